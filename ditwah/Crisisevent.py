@@ -0,0 +1,464 @@
+"""
+Crisis Event Pipeline
+
+This script processes news feed text files to extract and validate
+structured crisis event data using Pydantic models and LLM extraction.
+
+Input: data/News Feed.txt
+Output: output/flood_report.parquet (--format xlsx/csv for other formats)
+"""
+
+import sys
+import os
+import asyncio
+import argparse
+import json
+import time
+import shutil
+import logging
+import pandas as pd
+from tqdm import tqdm
+from tqdm.contrib.logging import logging_redirect_tqdm
+from pydantic import BaseModel, Field, ValidationError
+from typing import Optional, Literal, get_args
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+from ditwah import DATA_DIR, OUTPUT_DIR
+from ditwah.extract_json import extract_json_batch_async, extract_json_batch_job
+from utils.config_loader import get_max_concurrency, get_requests_per_minute
+from utils.rate_limit import AsyncRateLimiter
+
+# Configuration
+INPUT_FILE = str(DATA_DIR / 'News Feed.txt')
+OUTPUT_FILE = str(OUTPUT_DIR / 'flood_report.xlsx')
+OUTPUT_FORMATS = ('parquet', 'xlsx', 'csv')  # first is the default
+CHECKPOINT_EVERY = 100  # validated events per checkpoint chunk
+MAX_CONCURRENCY = get_max_concurrency()  # in-flight LLM requests
+REQUESTS_PER_MINUTE = get_requests_per_minute()  # request starts per minute
+BATCH_SIZE = 10  # news lines per LLM call
+BATCH_API_THRESHOLD = 50  # files with more lines go through the provider Batch API
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+
+District = Literal[
+    "Ampara", "Anuradhapura", "Badulla", "Batticaloa", "Colombo", 
+    "Galle", "Gampaha", "Hambantota", "Jaffna", "Kalutara", 
+    "Kandy", "Kegalle", "Kilinochchi", "Kurunegala", "Mannar", 
+    "Matale", "Matara", "Monaragala", "Mullaitivu", "Nuwara Eliya", 
+    "Polonnaruwa", "Puttalam", "Ratnapura", "Trincomalee", "Vavuniya"
+]
+
+# Same values as District, for a cheap membership check before full validation
+DISTRICTS = frozenset(get_args(District))
+
+
+class CrisisEvent(BaseModel):
+    """Pydantic model for validating crisis event data."""
+    
+    district: District
+
+    flood_level_meters: Optional[float] = None
+    victim_count: Optional[int] = Field(default=0, alias="vicLm_count")
+    main_need: Optional[str] = Field(default="None")
+    status: Literal["Critical", "Warning", "Stable"]
+
+
+if HAS_PYARROW:
+    # Column types of CrisisEvent.model_dump(), fixed so that every report
+    # and checkpoint chunk agrees even when a column is all None
+    EVENT_SCHEMA = pa.schema([
+        ('district', pa.string()),
+        ('flood_level_meters', pa.float64()),
+        ('victim_count', pa.int64()),
+        ('main_need', pa.string()),
+        ('status', pa.string()),
+    ])
+
+
+def validate_event(record):
+    """
+    Validate one extracted record (the dict returned by extraction).
+
+    Returns (event_dict, None) on success, (None, (field, msg, details_json))
+    on a validation error, or (None, None) when there was nothing to validate.
+    """
+    if record is None:
+        return None, None
+    
+    # Reject unknown districts (the most common failure) before building the
+    # model; non-string values (lists, objects) are unhashable, so check the type first
+    district = record.get('district')
+    if not (isinstance(district, str) and district in DISTRICTS):
+        msg = "Input should be one of the 25 Sri Lankan districts"
+        details = json.dumps([{'type': 'literal_error', 'loc': ['district'], 'msg': msg, 'input': district}])
+        return None, ('district', msg, details)
+    
+    try:
+        return CrisisEvent.model_validate(record).model_dump(), None
+    except ValidationError as e:
+        error_details = e.errors()[0] if e.errors() else {}
+        field = error_details.get('loc', ['unknown'])[0]
+        msg = error_details.get('msg', 'Unknown error')
+        return None, (field, msg, e.json())
+
+
+def validate_events(records):
+    """Validate a batch of extracted records."""
+    return [validate_event(record) for record in records]
+
+
+def is_valid_record(record):
+    """Tell whether an extracted record passes validation (used to gate caching)."""
+    return record is not None and validate_event(record)[1] is None
+
+
+def ensure_output_directory(output_path):
+    """Create output directory if it doesn't exist."""
+    output_dir = os.path.dirname(output_path)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+        print(f"Created output directory: {output_dir}")
+
+
+def save_events(events: list, output_file: str, fmt: str = 'parquet'):
+    """
+    Write validated events next to output_file with the extension of fmt.
+
+    Parquet is a single columnar dump via pyarrow; xlsx goes through
+    pandas/openpyxl, which is much slower on large reports. A format whose
+    writer is not installed falls back to the next one in OUTPUT_FORMATS.
+
+    Returns:
+        Path of the file actually written
+    """
+    base = os.path.splitext(output_file)[0]
+    
+    if fmt == 'parquet':
+        if HAS_PYARROW:
+            path = base + '.parquet'
+            pq.write_table(pa.Table.from_pylist(events, schema=EVENT_SCHEMA), path)
+            return path
+        print("Note: pyarrow not installed, falling back to Excel")
+        fmt = 'xlsx'
+    
+    df = pd.DataFrame(events)
+    if fmt == 'xlsx':
+        try:
+            path = base + '.xlsx'
+            df.to_excel(path, index=False)
+            return path
+        except ModuleNotFoundError:
+            print("Note: openpyxl not installed, falling back to CSV")
+    
+    path = base + '.csv'
+    df.to_csv(path, index=False)
+    return path
+
+
+def write_checkpoint(events: list, checkpoint_dir: str, start: int):
+    """
+    Write one chunk of validated events as its own file in checkpoint_dir.
+
+    Files are named after the index of their first event (start), so they
+    sort in report order.
+
+    Every chunk is a complete file (Parquet when pyarrow is installed, CSV
+    otherwise), so a crash mid-run leaves all earlier chunks readable,
+    e.g. with pd.read_parquet(checkpoint_dir).
+    """
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    stem = os.path.join(checkpoint_dir, f'part-{start:08d}')
+    if HAS_PYARROW:
+        pq.write_table(pa.Table.from_pylist(events, schema=EVENT_SCHEMA), stem + '.parquet')
+    else:
+        pd.DataFrame(events).to_csv(stem + '.csv', index=False)
+
+
+async def extract_limited(texts: list, sem: asyncio.Semaphore, limiter: AsyncRateLimiter):
+    """Extract one batch of lines within the concurrency and rate limits."""
+    async with sem:
+        return await extract_json_batch_async(texts, limiter, accept=is_valid_record)
+
+
+def iter_lines(input_file: str):
+    """Yield the stripped, non-empty lines of a file one at a time."""
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def iter_batches(lines, size: int = BATCH_SIZE):
+    """Group an iterable of lines into lists of at most size lines."""
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def produce_batches(input_file: str, queue: asyncio.Queue, tasks: set,
+                          sem: asyncio.Semaphore, limiter: AsyncRateLimiter):
+    """
+    Read the input lazily and schedule one extraction task per batch.
+
+    The bounded queue applies back-pressure: reading pauses while
+    queue.maxsize batches are scheduled but not yet consumed, so memory
+    stays flat regardless of file size. A None entry marks the end; a
+    read error is passed through the queue for the consumer to raise.
+    """
+    try:
+        for batch in iter_batches(iter_lines(input_file)):
+            task = asyncio.ensure_future(extract_limited(batch, sem, limiter))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            await queue.put((batch, task))
+    except Exception as e:
+        await queue.put(e)
+        return
+    await queue.put(None)
+
+
+async def run_pipeline_async(input_file: str, output_file: str, live: bool = False,
+                             fmt: str = OUTPUT_FORMATS[0]):
+    """Run the crisis event extraction pipeline with comprehensive error handling.
+
+    Files longer than BATCH_API_THRESHOLD lines are submitted as one
+    provider batch job (cheaper, no rate limiting, but may take hours)
+    unless live=True forces the live concurrent path. The report is
+    written in fmt (see save_events).
+
+    Validated events are also written to a checkpoint directory every
+    CHECKPOINT_EVERY events so a crash loses little work; it is removed
+    once the report is saved. A checkpoint left by a crashed run is moved
+    aside (never deleted) when the next run starts. Re-running after a
+    crash is cheap because finished extractions come back from the
+    response cache.
+    """
+    
+    print("\n" + "=" * 60)
+    print("CRISIS EVENT EXTRACTION PIPELINE")
+    print("=" * 60)
+    
+    # Check input file exists
+    if not os.path.exists(input_file):
+        print(f"\nERROR: Input file not found: {input_file}")
+        print("Please ensure the file exists and the path is correct.")
+        return False
+    
+    # Ensure output directory exists
+    ensure_output_directory(output_file)
+    
+    valid_events = []
+    checkpoint_dir = os.path.splitext(output_file)[0] + '.partial'
+    flushed = 0  # events already written to the checkpoint
+    tasks = set()
+    producer = None
+    progress = None
+    total_lines = 0
+    success_count = 0
+    validation_errors = 0
+    processing_errors = 0
+
+    # A leftover checkpoint holds the events of a run that crashed; move it
+    # aside for recovery rather than mixing it with (or deleting it for)
+    # this run's chunks
+    if os.path.isdir(checkpoint_dir) and os.listdir(checkpoint_dir):
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        kept_dir, suffix = f"{checkpoint_dir}.{stamp}", 1
+        while os.path.exists(kept_dir):
+            suffix += 1
+            kept_dir = f"{checkpoint_dir}.{stamp}-{suffix}"
+        os.rename(checkpoint_dir, kept_dir)
+        print(f"Found a checkpoint from an earlier run, moved it to: {kept_dir}")
+    else:
+        shutil.rmtree(checkpoint_dir, ignore_errors=True)
+
+    try:
+        # Count lines with a streaming pass; they are re-read lazily below
+        total_lines = sum(1 for _ in iter_lines(input_file))
+        
+        if total_lines == 0:
+            print("WARNING: Input file is empty.")
+            return False
+        
+        print(f"\nProcessing {total_lines} news items...")
+        print("-" * 60)
+        
+        # Lines are sent in batches of BATCH_SIZE per call. Scheduled batches
+        # flow through a queue and are consumed line by line in input order.
+        if not live and total_lines > BATCH_API_THRESHOLD:
+            # A batch job needs the whole input up front
+            batches = list(iter_batches(iter_lines(input_file)))
+            print(f"Submitting {len(batches)} requests as a batch job (use --live for live calls)...")
+            job_results = await extract_json_batch_job(batches, accept=is_valid_record)
+            queue = asyncio.Queue()
+            for batch, items in zip(batches, job_results):
+                # Wrap finished results so the loop below treats both paths alike
+                queue.put_nowait((batch, asyncio.ensure_future(asyncio.sleep(0, result=items))))
+            queue.put_nowait(None)
+        else:
+            sem = asyncio.Semaphore(MAX_CONCURRENCY)
+            limiter = AsyncRateLimiter(REQUESTS_PER_MINUTE)
+            queue = asyncio.Queue(maxsize=MAX_CONCURRENCY * 2)
+            producer = asyncio.ensure_future(produce_batches(input_file, queue, tasks, sem, limiter))
+        
+        # Per-line detail goes to logging.debug; the console only gets a
+        # progress bar, which redraws at a fixed rate however fast lines finish.
+        # Warnings are routed through tqdm.write so they print above the bar
+        # instead of breaking it.
+        progress = tqdm(total=total_lines, desc="Extracting", unit="item")
+        
+        with logging_redirect_tqdm():
+            i = 0
+            while (entry := await queue.get()) is not None:
+                if isinstance(entry, Exception):
+                    raise entry
+                batch, task = entry
+                validated = None
+                
+                for offset, clean_line in enumerate(batch):
+                    i += 1
+                    logging.debug("[%d/%d] Processing: %.50s", i, total_lines, clean_line)
+                    
+                    try:
+                        # Extract JSON from text
+                        batch_results = await task
+                        
+                        if batch_results[offset] is None:
+                            processing_errors += 1
+                            logging.warning("Line %d: no JSON extracted", i)
+                            continue
+                        
+                        # Validate with Pydantic, one whole batch at a time
+                        if validated is None:
+                            validated = validate_events(batch_results)
+                        event, error = validated[offset]
+                        
+                        if error is not None:
+                            field, msg, details = error
+                            validation_errors += 1
+                            logging.debug("Line %d validation error: %s - %s", i, field, msg)
+                            logging.warning("Line %d failed validation: %s", i, details)
+                            continue
+                        
+                        valid_events.append(event)
+                        success_count += 1
+                        logging.debug("Line %d OK: %s - %s", i, event['district'], event['status'])
+                        
+                    except RuntimeError as e:
+                        processing_errors += 1
+                        logging.warning("Line %d could not be processed: %s", i, e)
+                        
+                    except Exception as e:
+                        processing_errors += 1
+                        logging.warning("Line %d failed: %s", i, e)
+                    
+                    finally:
+                        progress.update(1)
+                
+                # Checkpoint off the event loop; a failed write is retried with
+                # the next batch rather than stopping the run
+                if len(valid_events) - flushed >= CHECKPOINT_EVERY:
+                    try:
+                        await asyncio.to_thread(
+                            write_checkpoint, valid_events[flushed:], checkpoint_dir, flushed
+                        )
+                        flushed = len(valid_events)
+                    except OSError as e:
+                        logging.warning("Checkpoint write failed: %s", e)
+
+        progress.close()
+        
+        # Save results
+        print("\n" + "-" * 60)
+        print("SAVING RESULTS")
+        print("-" * 60)
+        
+        if valid_events:
+            saved_file = save_events(valid_events, output_file, fmt)
+            print(f"SUCCESS! Report saved to: {saved_file}")
+        else:
+            print("WARNING: No valid events found to save.")
+        shutil.rmtree(checkpoint_dir, ignore_errors=True)
+
+    except FileNotFoundError:
+        print(f"ERROR: The file {input_file} was not found.")
+        return False
+        
+    except UnicodeDecodeError:
+        print("ERROR: File encoding issue. Try converting to UTF-8.")
+        return False
+        
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        if producer is not None:
+            producer.cancel()
+        for task in list(tasks):
+            task.cancel()
+        print("\n\nINTERRUPTED BY USER (Ctrl+C)")
+        if valid_events:
+            print(f"Saving {len(valid_events)} events collected so far...")
+            base, ext = os.path.splitext(output_file)
+            saved_file = save_events(valid_events, base + '_partial' + ext, fmt)
+            print(f"Partial results saved to: {saved_file}")
+        shutil.rmtree(checkpoint_dir, ignore_errors=True)
+        return False
+        
+    except Exception as e:
+        print(f"UNEXPECTED ERROR: {e}")
+        logging.exception("Pipeline failed")
+        if flushed:
+            print(f"{flushed} events checkpointed so far are in: {checkpoint_dir}")
+        return False
+    
+    finally:
+        if progress is not None:
+            progress.close()
+    
+    # Print summary
+    print("\n" + "=" * 60)
+    print("PIPELINE COMPLETE")
+    print("=" * 60)
+    print(f"  Total items processed: {total_lines}")
+    print(f"  Successfully extracted: {success_count}")
+    print(f"  Validation errors:     {validation_errors}")
+    print(f"  Processing errors:     {processing_errors}")
+    print("=" * 60 + "\n")
+    
+    return True
+
+
+def run_pipeline(input_file: str, output_file: str, live: bool = False,
+                 fmt: str = OUTPUT_FORMATS[0]):
+    """Run the async extraction pipeline."""
+    return asyncio.run(run_pipeline_async(input_file, output_file, live, fmt))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crisis event extraction pipeline")
+    parser.add_argument(
+        '--live', action='store_true',
+        help=f"always use live API calls, even for files over {BATCH_API_THRESHOLD} lines"
+    )
+    parser.add_argument(
+        '--format', choices=OUTPUT_FORMATS, default=OUTPUT_FORMATS[0], dest='fmt',
+        help="report file format (default: %(default)s)"
+    )
+    args = parser.parse_args()
+    run_pipeline(INPUT_FILE, OUTPUT_FILE, live=args.live, fmt=args.fmt)
@@ -0,0 +1,18 @@
+"""
+Operation Ditwah pipeline scripts.
+
+Run each part from the project root:
+    python -m ditwah.message_classification   # Part 1
+    python -m ditwah.cot_scenarios            # Part 2
+    python -m ditwah.logistic_commander       # Part 3
+    python -m ditwah.Crisisevent              # Part 5
+
+Data and output paths are resolved against the project root, so the
+scripts do not depend on the current working directory.
+"""
+
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+OUTPUT_DIR = PROJECT_ROOT / "output"
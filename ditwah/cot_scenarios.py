@@ -0,0 +1,334 @@
+"""
+Chain-of-Thought Reasoning for Crisis Scenarios
+
+This script reads crisis scenarios from a text file and analyzes them using
+Chain-of-Thought reasoning with temperature stress testing.
+
+Input: data/Scenarios.txt
+Output: output/cot_results.txt
+"""
+
+import sys
+import os
+import asyncio
+import argparse
+
+from ditwah import DATA_DIR, OUTPUT_DIR
+from utils.prompts import render
+from utils.llm_client import get_client
+from utils.llm_cache import acached_chat
+from utils.retry_utils import retry_delay
+from utils.router import pick_model
+
+# Configuration
+SCENARIOS_FILE = str(DATA_DIR / "Scenarios.txt")
+OUTPUT_FILE = str(OUTPUT_DIR / "cot_results.txt")
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0  # seconds, doubled per attempt with jitter
+STRESS_RUNS = 3  # temperature=1 samples per scenario
+SKIP_DETERMINISTIC = False  # default for --skip-deterministic
+
+
+async def acall_with_retry(client, messages, temperature, max_tokens, n=1):
+    """Call LLM with retry logic for None responses.
+
+    Only deterministic (temperature=0) calls are cached. The temperature=1
+    stress-test samples always go to the network, so every run draws
+    fresh samples.
+    """
+    response = {'text': None}
+    for attempt in range(MAX_RETRIES):
+        try:
+            response = await acached_chat(
+                client, messages,
+                temperature=temperature, max_tokens=max_tokens, n=n
+            )
+            if response.get('text') is not None:
+                return response
+            print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] Got None response, retrying...")
+            await asyncio.sleep(retry_delay(attempt, base=RETRY_BASE_DELAY))
+        except Exception as e:
+            print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] API error: {str(e)[:50]}...")
+            await asyncio.sleep(retry_delay(attempt, e, base=RETRY_BASE_DELAY))
+    return response  # Return last response even if None
+
+
+def ensure_output_directory(output_path):
+    """Create output directory if it doesn't exist."""
+    output_dir = os.path.dirname(output_path)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+        print(f"Created output directory: {output_dir}")
+
+
+def iter_scenarios(file_path, encoding='utf-8'):
+    """Yield scenarios from file one at a time.
+
+    Only the lines of the current scenario are held in memory.
+    """
+    buf = []
+    
+    with open(file_path, 'r', encoding=encoding) as f:
+        for line in f:
+            if line.startswith("SCENARIO"):
+                if buf:
+                    yield "".join(buf)
+                buf = [line]
+            else:
+                buf.append(line)
+    
+    # Don't forget the last scenario
+    if buf:
+        yield "".join(buf)
+
+
+def build_messages(problem):
+    """Render the CoT prompt for one scenario; returns (messages, spec)."""
+    prompt_text, spec = render(
+        'cot_reasoning.v1',
+        role='damage controlling officer',
+        problem=problem
+    )
+
+    instruction = """
+    Identify the immediate life threat, immediate health threat, and any other critical issues. Then provide a plan to address them.
+    """
+
+    full_prompt = f"""text: {prompt_text}
+
+    instruction: {instruction}"""
+
+    return [{'role': 'user', 'content': full_prompt}], spec
+
+
+def start_scenario(client, problem, skip_deterministic=False):
+    """Start the T=1 and T=0 requests for a scenario.
+
+    The two runs share the prompt but not each other's output, so both are
+    in flight at once. Returns a future resolving to (t1_response, t0_response);
+    t0_response is None when the deterministic run is skipped.
+
+    The T=0 run goes through the response cache, so on re-runs it is a
+    local lookup rather than a network call.
+    """
+    messages, spec = build_messages(problem)
+    t1 = asyncio.create_task(acall_with_retry(client, messages, temperature=1, max_tokens=spec.max_tokens, n=STRESS_RUNS))
+    if skip_deterministic:
+        t0 = asyncio.sleep(0)  # resolves to None
+    else:
+        t0 = asyncio.create_task(acall_with_retry(client, messages, temperature=0, max_tokens=spec.max_tokens))
+    return asyncio.gather(t1, t0)
+
+
+async def main_async(skip_deterministic=SKIP_DETERMINISTIC):
+    """Main function with comprehensive error handling."""
+    
+    print("\n" + "=" * 60)
+    print("CHAIN-OF-THOUGHT SCENARIO ANALYSIS")
+    print("=" * 60)
+    
+    # Check if input file exists
+    if not os.path.exists(SCENARIOS_FILE):
+        print(f"\nERROR: Scenarios file not found: {SCENARIOS_FILE}")
+        print("Please ensure the file exists and the path is correct.")
+        sys.exit(1)
+    
+    # Ensure output directory exists
+    ensure_output_directory(OUTPUT_FILE)
+    
+    # Initialize the LLM client
+    print("\nInitializing reasoning model...")
+    try:
+        reasoning_model = pick_model('google', 'cot')
+        client_reasoning = get_client('google', reasoning_model)
+        print(f"Model loaded: {reasoning_model}")
+    except Exception as e:
+        print(f"ERROR: Failed to initialize LLM client: {e}")
+        sys.exit(1)
+    
+    # Count scenarios with a streaming pass; they are re-read lazily below
+    print(f"\nLoading scenarios from: {SCENARIOS_FILE}")
+    encoding = 'utf-8'
+    try:
+        total_scenarios = sum(1 for _ in iter_scenarios(SCENARIOS_FILE, encoding))
+    except UnicodeDecodeError:
+        print("Warning: UTF-8 decoding failed, trying with latin-1 encoding...")
+        encoding = 'latin-1'
+        total_scenarios = sum(1 for _ in iter_scenarios(SCENARIOS_FILE, encoding))
+    except Exception as e:
+        print(f"ERROR: Could not read scenarios file: {e}")
+        sys.exit(1)
+    
+    # Handle empty scenarios
+    if not total_scenarios:
+        print("WARNING: No scenarios found in the file.")
+        print("Ensure scenarios start with 'SCENARIO' keyword.")
+        sys.exit(0)
+    
+    print(f"Found {total_scenarios} scenarios to process\n")
+    
+    # Progress tracking
+    success_count = 0
+    error_count = 0
+    
+    try:
+        # Open output file for writing
+        with open(OUTPUT_FILE, 'w', encoding='utf-8') as out_f:
+            
+            pending_lines = []
+            
+            def write_output(text):
+                """Queue a line for the console and the output file"""
+                pending_lines.append(text)
+            
+            def emit(lines):
+                """Print and write a block of lines to file"""
+                block = "\n".join(lines)
+                print(block)
+                out_f.write(block + "\n")
+            
+            async def flush_output():
+                """Write queued lines on a worker thread so in-flight requests keep progressing"""
+                if pending_lines:
+                    lines = pending_lines[:]
+                    pending_lines.clear()
+                    await asyncio.to_thread(emit, lines)
+            
+            # Header
+            write_output("=" * 80)
+            write_output("CHAIN-OF-THOUGHT REASONING RESULTS")
+            write_output("=" * 80)
+            write_output("")
+            await flush_output()
+            
+            # Double-buffer: the next scenario's requests are started as soon
+            # as the current one's responses arrive, before any output is written
+            scenarios = enumerate(iter_scenarios(SCENARIOS_FILE, encoding), 1)
+            current = next(scenarios, None)
+            in_flight = start_scenario(client_reasoning, current[1], skip_deterministic) if current else None
+            
+            while current is not None:
+                scenario_num, problem = current
+                print(f"  Waiting on temperature=1 ({STRESS_RUNS} samples){'' if skip_deterministic else ' and temperature=0'} runs for problem {scenario_num}...")
+                t1_response, t0_response = await in_flight
+                
+                current = next(scenarios, None)
+                if current is not None:
+                    in_flight = start_scenario(client_reasoning, current[1], skip_deterministic)
+                
+                # Scenario header
+                write_output("-" * 80)
+                write_output(f"PROBLEM {scenario_num} of {total_scenarios}")
+                write_output("-" * 80)
+                write_output(problem.strip())
+                write_output("")
+
+                # Temperature 1 tests
+                write_output("")
+                write_output(f"{'─' * 40}")
+                write_output(f"TEMPERATURE 1 STRESS TEST (Problem {scenario_num})")
+                write_output(f"{'─' * 40}")
+                
+                texts = (t1_response.get('texts') if t1_response else None) or []
+                
+                for run in range(1, STRESS_RUNS + 1):
+                    result_text = texts[run - 1] if run <= len(texts) else None
+                    
+                    write_output("")
+                    write_output(f"► Run {run}:")
+                    
+                    if result_text is None:
+                        write_output("[ERROR: No response received from LLM]")
+                        error_count += 1
+                    else:
+                        write_output(result_text)
+                        success_count += 1
+                    
+                    write_output("")
+
+                # Temperature 0 test
+                if not skip_deterministic:
+                    cached = bool(t0_response and t0_response.get('meta', {}).get('cache_hit'))
+                    
+                    write_output(f"{'─' * 40}")
+                    write_output(f"TEMPERATURE 0 TEST (Problem {scenario_num})")
+                    write_output(f"{'─' * 40}")
+                    
+                    result_text = t0_response.get('text') if t0_response else None
+                    
+                    write_output("")
+                    write_output(f"► Deterministic Run{' (cached)' if cached else ''}:")
+                    
+                    if result_text is None:
+                        write_output("[ERROR: No response received from LLM]")
+                        error_count += 1
+                    else:
+                        write_output(result_text)
+                        success_count += 1
+                
+                write_output("")
+                await flush_output()
+                
+            # Footer
+            write_output("=" * 80)
+            write_output("END OF RESULTS")
+            write_output("=" * 80)
+            await flush_output()
+    
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\n\n" + "=" * 60)
+        print("INTERRUPTED BY USER (Ctrl+C)")
+        print("=" * 60)
+        print(f"Partial results saved to: {OUTPUT_FILE}")
+    
+    except Exception as e:
+        print(f"\nERROR during processing: {e}")
+        error_count += 1
+    
+    # Print summary
+    print("\n" + "=" * 60)
+    print("PROCESSING COMPLETE")
+    print("=" * 60)
+    print(f"  Scenarios processed: {total_scenarios}")
+    print(f"  Successful LLM calls: {success_count}")
+    print(f"  Failed LLM calls:     {error_count}")
+    print(f"\n  Results saved to: {OUTPUT_FILE}")
+    print("=" * 60 + "\n")
+
+
+def main():
+    """Parse command-line options and run the async scenario analysis."""
+    parser = argparse.ArgumentParser(description="Chain-of-thought temperature stress test")
+    parser.add_argument(
+        '--skip-deterministic', action='store_true', default=SKIP_DETERMINISTIC,
+        help="only run the temperature=1 stress test, skipping the temperature=0 run"
+    )
+    args = parser.parse_args()
+    asyncio.run(main_async(skip_deterministic=args.skip_deterministic))
+
+
+if __name__ == "__main__":
+    main()
+
+
+"""
+================================================================================
+TEMPERATURE COMPARISON ANALYSIS: Safe Mode (Temp 0.0) vs Chaos Mode (Temp 1.0)
+================================================================================
+
+In terms of Consistency, Safe Mode (Temp 0.0) is highly structured and follows a rigid 
+hierarchy of needs (Life > Health > Welfare). In contrast, Chaos Mode (Temp 1.0) is 
+variable—while the core logic remains sound, the "flavor" and specific action steps 
+shift between runs.
+
+Regarding Drift and Hallucination, Safe Mode focuses strictly on provided facts such as 
+blocked roads, rising water, and medical status. Chaos Mode exhibits minor drift: Run 1 
+suggested "Air Rescue" or "Amphibious Task Force," while Run 3 suggested "Medical supply 
+drops." These are logical leaps not explicitly requested in the original scenario.
+
+For Detail Sensitivity, Safe Mode is very literal—it addresses the "2-hour battery" vs. 
+"30-minute generator" as a mathematical safety margin. Chaos Mode demonstrates creative 
+problem solving: Run 1 (Scenario A) suggested the uncle use a "belt or cloth to lash 
+himself to the tree"—a creative detail not found in the Safe output.
+================================================================================
+"""
@@ -0,0 +1,232 @@
+"""
+Chain-of-Thought Incident Scoring Module
+
+This module scores disaster incidents based on severity criteria using
+Chain-of-Thought reasoning to analyze each incident.
+
+Used by: logistic_commander.py
+"""
+
+import re
+import asyncio
+
+from utils.prompts import render
+from utils.llm_client import get_client
+from utils.llm_cache import acached_chat
+from utils.retry_utils import retry_delay
+from utils.router import pick_model
+from utils.config_loader import get_max_concurrency
+
+# Configuration
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0  # seconds, doubled per attempt with jitter
+DEFAULT_SCORE = 5  # Default score when extraction fails
+
+
+async def acall_with_retry(client, messages, temperature, max_tokens, sem):
+    """Call LLM with retry logic for None responses and API errors.
+
+    The semaphore is held only while a request is in flight, not while
+    waiting out the retry delay.
+    """
+    last_error = None
+    response = {'text': None}
+    for attempt in range(MAX_RETRIES):
+        try:
+            async with sem:
+                response = await acached_chat(client, messages, temperature=temperature, max_tokens=max_tokens)
+            if response.get('text') is not None:
+                return response, None
+            print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] Got None response, retrying...")
+            await asyncio.sleep(retry_delay(attempt, base=RETRY_BASE_DELAY))
+        except Exception as e:
+            last_error = str(e)
+            print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] API error: {last_error[:50]}...")
+            await asyncio.sleep(retry_delay(attempt, e, base=RETRY_BASE_DELAY))
+    return response, last_error
+
+
+def initialize_clients():
+    """Initialize the reasoning LLM client with error handling."""
+    try:
+        reasoning_model = pick_model('google', 'cot')
+        client_reasoning = get_client('google', reasoning_model)
+        
+        return client_reasoning, None
+    except Exception as e:
+        return None, str(e)
+
+
+# Scoring criteria
+CRITERIA = """
+Based on the given incident, provide a mark for that, start with basic score of 5 for each incident and then add or subtract based on the following criteria:
+1. If the age is less than 5 or more than 60, add 2 to the score
+2. If there is a life threat or need a rescue add 3 to the score
+3. If there is a need of Medicine (Insulin) add 1 to the score
+End your response with exactly one line: FINAL_SCORE: <integer 0-15>
+"""
+
+# Marker line the reasoning model is asked to finish with (see CRITERIA).
+# Models often bold it or vary its case: "**FINAL_SCORE:** 10",
+# "Final Score: **10**", so markdown emphasis is allowed around each part.
+_FINAL_SCORE_RE = re.compile(r'final[_\s]*score[*_\s]*:[*_\s]*(\d+)', re.IGNORECASE)
+
+# Looser fallback for replies that skip the marker, e.g. "Answer: **10**"
+_LOOSE_SCORE_RE = re.compile(r'(?:final|score|:)[*_\s]*(\d{1,2})\b')
+
+_DIGIT_RE = re.compile(r'\d+')
+
+
+def parse_score_locally(reasoning_text):
+    """Read the score out of the reasoning text without another LLM call.
+
+    Returns the score string, or None if no in-range score was found.
+    """
+    # The answer comes last in a CoT reply, so an interim marker written
+    # earlier in the reasoning must not win
+    markers = _FINAL_SCORE_RE.findall(reasoning_text)
+    if markers:
+        return markers[-1]
+    
+    # Same for the looser fallback: prefer the last candidate
+    for candidate in reversed(_LOOSE_SCORE_RE.findall(reasoning_text.lower())):
+        if 0 <= int(candidate) <= 15:
+            return candidate
+    
+    return None
+
+
+def extract_numeric_score(score_text):
+    """Extract numeric score from text, handling various formats."""
+    if score_text is None:
+        return DEFAULT_SCORE
+    
+    # Clean the text
+    cleaned = score_text.strip().lower()
+    
+    # Handle 'none' or empty
+    if cleaned in ['none', '', 'null']:
+        return DEFAULT_SCORE
+    
+    # Try to extract digits
+    numbers = _DIGIT_RE.findall(cleaned)
+    if numbers:
+        score = int(numbers[0])
+        # Sanity check: score should be between 0 and 15
+        if 0 <= score <= 15:
+            return score
+    
+    return DEFAULT_SCORE
+
+
+async def _score_one(index, row, total_incidents, sem, client_reasoning):
+    """Score a single incident with one CoT call ending in a FINAL_SCORE line."""
+    incident_id = row.get('ID', f'Unknown-{index}')
+    area = row.get('Area', 'Unknown')
+    label = f"[{index + 1}/{total_incidents}] ID {incident_id}"
+    
+    try:
+        print(f"{label}: Analyzing with CoT reasoning model... (Area: {area})")
+        
+        # Build incident string safely
+        incident = f"Time: {row.get('Time', 'N/A')}, Area: {area}, People: {row.get('People', 'N/A')}, Ages: {row.get('Ages', 'N/A')}, Main Need: {row.get('Main Need', 'N/A')}, Message: {row.get('Message', 'N/A')}"
+        problem = f"{CRITERIA}\nIncident: {incident}"
+        
+        prompt_text, spec = render(
+            'cot_reasoning.v1',
+            role='damage controlling officer',
+            problem=problem
+        )
+
+        # Call reasoning model
+        messages = [{'role': 'user', 'content': problem}]
+        response, error = await acall_with_retry(client_reasoning, messages, temperature=0, max_tokens=spec.max_tokens, sem=sem)
+        
+        reasoning_text = response.get('text') if response else None
+        if reasoning_text is None:
+            reasoning_text = f"Unable to analyze - defaulting to base score of {DEFAULT_SCORE}"
+            print(f"{label}: Warning: Reasoning model failed, using default")
+        
+        # Read the score locally, no second LLM call
+        score_text = parse_score_locally(reasoning_text)
+        final_score = extract_numeric_score(score_text)
+        
+        if score_text is None or final_score == DEFAULT_SCORE:
+            print(f"{label}: Warning: Using default score: {DEFAULT_SCORE}")
+        
+        print(f"{label}: Score assigned: {final_score}")
+        return index, incident_id, area, final_score, score_text is not None, None
+        
+    except Exception as e:
+        print(f"{label}: ERROR processing incident: {e}")
+        return index, incident_id, area, DEFAULT_SCORE, False, str(e)
+
+
+async def score_incident_async(data):
+    """Score incidents concurrently with comprehensive error handling."""
+    
+    # Initialize client
+    client_reasoning, init_error = initialize_clients()
+    if init_error:
+        print(f"ERROR: Failed to initialize LLM client: {init_error}")
+        return {}
+    
+    # Handle empty dataframe
+    if data is None or data.empty:
+        print("WARNING: No incident data provided.")
+        return {}
+    
+    scores = {}
+    total_incidents = len(data)
+    success_count = 0
+    error_count = 0
+    local_extraction_hits = 0
+    
+    print("\n" + "=" * 60)
+    print("INCIDENT SCORING PROCESS")
+    print("=" * 60)
+    print(f"Total incidents to process: {total_incidents}")
+    print("-" * 60)
+    
+    # Required columns check
+    required_cols = ['ID', 'Area', 'Time', 'People', 'Ages', 'Main Need', 'Message']
+    missing_cols = [col for col in required_cols if col not in data.columns]
+    if missing_cols:
+        print(f"WARNING: Missing columns in data: {missing_cols}")
+        print("Some incident details may be incomplete.")
+    
+    # Score all incidents concurrently, bounded by the semaphore
+    sem = asyncio.Semaphore(get_max_concurrency())
+    results = await asyncio.gather(*[
+        _score_one(index, row, total_incidents, sem, client_reasoning)
+        for index, row in data.iterrows()
+    ])
+    
+    # Assemble scores in the original incident order
+    for index, incident_id, area, final_score, parsed, error in sorted(results, key=lambda r: r[0]):
+        if parsed:
+            local_extraction_hits += 1
+        if error is None:
+            scores[f"Incident ID {incident_id}"] = final_score
+            scores[f"Incident Area {area}"] = area
+            success_count += 1
+        else:
+            error_count += 1
+            # Use default score on error
+            scores[f"Incident ID {incident_id}"] = DEFAULT_SCORE
+    
+    print("\n" + "-" * 60)
+    print("SCORING COMPLETE!")
+    print("-" * 60)
+    print(f"Successfully scored: {success_count}/{total_incidents}")
+    print(f"Errors: {error_count}")
+    print(f"Scores parsed from reasoning text: {local_extraction_hits}/{total_incidents}")
+    print("Final Scores:", {k: v for k, v in scores.items() if 'ID' in k})
+    print("=" * 60 + "\n")
+    
+    return scores
+
+
+def score_incident(data):
+    """Score incidents; synchronous entry point used by logistic_commander."""
+    return asyncio.run(score_incident_async(data))
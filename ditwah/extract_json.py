@@ -0,0 +1,272 @@
+"""
+JSON Extraction Module for Crisis Events
+
+This module extracts structured JSON data from unstructured text
+describing flood/disaster events using LLM-based extraction.
+
+Used by: Crisisevent.py
+"""
+
+import json
+import asyncio
+import hashlib
+import logging
+import contextlib
+
+from utils.prompts import render
+from utils.llm_client import get_client
+from utils.llm_cache import make_item_key, get_cached, put_cached
+from utils.config_loader import is_cache_enabled
+from utils.retry_utils import retry_delay, is_permanent_error
+from utils.json_utils import fast_loads, fast_dumps
+from utils.router import pick_model
+
+# Configuration
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 2.0  # seconds, doubled per attempt with jitter
+BATCH_POLL_SECONDS = 60  # how often to check a provider batch job
+
+
+def get_extraction_client():
+    """Get the shared LLM client for the general-purpose Gemini model."""
+    try:
+        return get_client('google', pick_model('google', 'general'))
+    except Exception as e:
+        raise RuntimeError(f"Failed to initialize LLM client: {e}")
+
+
+def validate_json(json_str):
+    """Validate that the string is valid JSON."""
+    try:
+        parsed = fast_loads(json_str)
+        return True, parsed, None
+    except json.JSONDecodeError as e:
+        return False, None, str(e)
+
+
+SCHEMA = """
+    {
+    "district": "String (Must be one of the 25 Sri Lankan districts)",
+    "flood_level_meters": "Float or null (Use null if not mentioned)",
+    "vicLm_count": "Integer",
+    "main_need": "String (The most urgent requirement mentioned)",
+    "status": "String (MUST be exactly 'Critical', 'Warning', or 'Stable')"
+    }
+    """
+
+
+# The prompt is fixed apart from the input texts, so render it once and
+# splice each call's texts in with string concatenation
+_TEXT_PLACEHOLDER = '__TEXT__'
+_COUNT_PLACEHOLDER = '__COUNT__'
+_BATCH_PROMPT_TEXT, _BATCH_SPEC = render(
+    'json_extract_batch.v1',
+    schema=SCHEMA,
+    texts=_TEXT_PLACEHOLDER,
+    count=_COUNT_PLACEHOLDER
+)
+_BATCH_PROMPT_HEAD, _BATCH_PROMPT_TAIL = _BATCH_PROMPT_TEXT.split(_TEXT_PLACEHOLDER, 1)
+
+# Fingerprint of the rendered prompt (template and SCHEMA), part of every
+# per-line cache key so editing either invalidates old extractions
+_PROMPT_HASH = hashlib.sha256(_BATCH_PROMPT_TEXT.encode('utf-8')).hexdigest()[:16]
+
+
+def build_batch_messages(texts):
+    """Build the batch extraction prompt for several news lines; returns (messages, spec)."""
+    numbered = "\n".join(f"{n}. {text}" for n, text in enumerate(texts, 1))
+    head = _BATCH_PROMPT_HEAD.replace(_COUNT_PLACEHOLDER, str(len(texts)))
+    prompt_text = head + numbered + _BATCH_PROMPT_TAIL
+    return [{'role': 'user', 'content': prompt_text}], _BATCH_SPEC
+
+
+def split_batch_response(result_text, count):
+    """
+    Split a JSON array reply into one parsed record per input text.
+
+    Objects are placed by their "index" field (falling back to position;
+    numeric strings like "2" are accepted); inputs the model skipped, or
+    objects with an unusable index, come back as None.
+
+    Returns:
+        Tuple of (items, error)
+    """
+    clean_json = result_text.replace("```json", "").replace("```", "").strip()
+    is_valid, parsed, error = validate_json(clean_json)
+    if not is_valid:
+        return None, f"Invalid JSON: {error}"
+    if not isinstance(parsed, list):
+        return None, "Expected a JSON array"
+    
+    items = [None] * count
+    for position, obj in enumerate(parsed, 1):
+        if not isinstance(obj, dict):
+            continue
+        index = obj.pop('index', position)
+        if isinstance(index, str) and index.strip().isdigit():
+            index = int(index)
+        if isinstance(index, int) and not isinstance(index, bool) and 1 <= index <= count:
+            items[index - 1] = obj
+    return items, None
+
+
+def _extraction_key(client, text):
+    """Cache key for one line's extraction (prompt + model + text)."""
+    return make_item_key(f"json_extract_batch.v1:{_PROMPT_HASH}:{client.model}", text)
+
+
+def lookup_extractions(client, texts, accept=None):
+    """
+    Return the cached extracted record for each text (None on a miss).
+
+    Cached records that accept() rejects are treated as misses.
+    """
+    if not is_cache_enabled():
+        return [None] * len(texts)
+    hits = [get_cached(_extraction_key(client, text)) for text in texts]
+    items = [fast_loads(hit['text']) if hit else None for hit in hits]
+    return [item if item is not None and (accept is None or accept(item)) else None for item in items]
+
+
+def store_extractions(client, texts, items, accept=None):
+    """
+    Cache fresh extractions so later runs skip the LLM for these lines.
+
+    Only records that accept() approves are stored, so an extraction that
+    fails validation is retried on the next run instead of replayed. The
+    cache is an optimisation: a failed write (locked database, a raising
+    accept()) is logged and skipped rather than failing the extraction.
+    """
+    if not is_cache_enabled():
+        return
+    for text, item in zip(texts, items):
+        try:
+            if item is not None and (accept is None or accept(item)):
+                put_cached(_extraction_key(client, text), {'text': fast_dumps(item)})
+        except Exception as e:
+            logging.warning("Could not cache extraction for %.50s: %s", text, e)
+
+
+def fill_missing(cached, items):
+    """Put freshly extracted items into the empty slots of a cached list."""
+    fresh = iter(items)
+    return [item if item is not None else next(fresh, None) for item in cached]
+
+
+async def extract_json_batch_async(texts, limiter=None, accept=None):
+    """
+    Extract structured JSON for several texts with a single LLM call.
+
+    Args:
+        texts: List of news lines
+        limiter: Optional AsyncRateLimiter acquired before every attempt
+        accept: Optional check on a parsed record; only records it
+            approves are cached
+
+    Returns:
+        List of parsed records aligned with texts (None where nothing was extracted)
+
+    Raises:
+        RuntimeError: If every attempt fails
+    """
+    if not texts:
+        return []
+    
+    client = get_extraction_client()
+    
+    # Lines extracted on a previous run are served from the cache
+    cached = lookup_extractions(client, texts, accept)
+    missing = [text for text, item in zip(texts, cached) if item is None]
+    if not missing:
+        return cached
+    
+    messages, spec = build_batch_messages(missing)
+    
+    items = None
+    last_error = None
+    for attempt in range(MAX_RETRIES):
+        error = None
+        try:
+            async with limiter or contextlib.nullcontext():
+                response = await client.achat(messages, temperature=0, max_tokens=spec.max_tokens)
+            result_text = response.get('text')
+            
+            if result_text is None:
+                last_error = "LLM returned None"
+            else:
+                items, last_error = split_batch_response(result_text, len(missing))
+                if items is not None:
+                    break
+                
+        except Exception as e:
+            error = e
+            last_error = str(e)
+            if is_permanent_error(e):
+                break
+        
+        if attempt < MAX_RETRIES - 1:
+            await asyncio.sleep(retry_delay(attempt, error, base=RETRY_BASE_DELAY))
+    
+    if items is None:
+        raise RuntimeError(f"Batch JSON extraction failed after {attempt + 1} attempts: {last_error}")
+    
+    # Cache outside the retry loop so a cache problem never costs another call
+    store_extractions(client, missing, items, accept)
+    return fill_missing(cached, items)
+
+
+async def extract_json_batch_job(batches, accept=None):
+    """
+    Extract structured JSON for all batches through the provider's Batch API.
+
+    Each batch becomes one request in a single batch job (the same
+    json_extract_batch.v1 prompt as the live path). The job is polled
+    every BATCH_POLL_SECONDS until it finishes.
+
+    Args:
+        batches: List of lists of news lines
+        accept: Optional check on a parsed record; only records it
+            approves are cached
+
+    Returns:
+        One list per batch of parsed records aligned with its lines
+        (None where nothing was extracted)
+
+    Raises:
+        RuntimeError: If the batch job fails, expires or is cancelled
+    """
+    if not batches:
+        return []
+    
+    client = get_extraction_client()
+    
+    # Only lines without a cached extraction go into the job
+    cached = [lookup_extractions(client, texts, accept) for texts in batches]
+    missing = [
+        [text for text, item in zip(texts, hits) if item is None]
+        for texts, hits in zip(batches, cached)
+    ]
+    pending = [b for b, texts in enumerate(missing) if texts]
+    if not pending:
+        return cached
+    
+    requests = []
+    for b in pending:
+        messages, spec = build_batch_messages(missing[b])
+        requests.append({'messages': messages, 'temperature': 0, 'max_tokens': spec.max_tokens})
+    
+    job_id = client.submit_batch(requests)
+    while True:
+        result_texts = client.get_batch_results(job_id)
+        if result_texts is not None:
+            break
+        await asyncio.sleep(BATCH_POLL_SECONDS)
+    
+    results = list(cached)
+    for k, b in enumerate(pending):
+        result_text = result_texts[k] if k < len(result_texts) else None
+        items = split_batch_response(result_text, len(missing[b]))[0] if result_text else None
+        items = items or [None] * len(missing[b])
+        store_extractions(client, missing[b], items, accept)
+        results[b] = fill_missing(cached[b], items)
+    return results
@@ -5,7 +5,7 @@ This script orchestrates disaster response logistics using:
 1. Chain-of-Thought (CoT) reasoning for incident scoring
 2. Tree-of-Thought (ToT) reasoning for strategic route planning
 
-Input: ../output/Incidents.csv
+Input: data/Incidents.csv
 Output: Console display of optimal rescue route
 """
 
@@ -13,19 +13,19 @@ import sys
 import os
 import time
 import pandas as pd
-sys.path.append("../..")
 
-from cot_scoring import score_incident
+from ditwah import DATA_DIR
+from ditwah.cot_scoring import score_incident
 from utils.prompts import render
-from utils.llm_client import LLMClient
+from utils.llm_client import get_client
 from utils.logging_utils import log_llm_call
+from utils.retry_utils import retry_delay
 from utils.router import pick_model, should_use_reasoning_model
-from utils.examples import examples
 
 # Configuration
-INCIDENTS_FILE = '../data/Incidents.csv'
+INCIDENTS_FILE = str(DATA_DIR / 'Incidents.csv')
 MAX_RETRIES = 3
-RETRY_DELAY = 2  # seconds
+RETRY_BASE_DELAY = 1.0  # seconds, doubled per attempt with jitter
 
 
 def call_with_retry(client, messages, temperature, max_tokens):
@@ -37,11 +37,11 @@ def call_with_retry(client, messages, temperature, max_tokens):
             if response.get('text') is not None:
                 return response, None
             print(f"[Retry {attempt + 1}/{MAX_RETRIES}] Got None response, retrying...")
-            time.sleep(RETRY_DELAY)
+            time.sleep(retry_delay(attempt, base=RETRY_BASE_DELAY))
         except Exception as e:
             last_error = str(e)
             print(f"[Retry {attempt + 1}/{MAX_RETRIES}] API error: {last_error[:50]}...")
-            time.sleep(RETRY_DELAY)
+            time.sleep(retry_delay(attempt, e, base=RETRY_BASE_DELAY))
     return response if 'response' in dir() else {'text': None}, last_error
 
 
@@ -157,7 +157,7 @@ def main():
     print("\nInitializing reasoning model...")
     try:
         reasoning_model = pick_model('google', 'cot')
-        client_reasoning = LLMClient('google', reasoning_model)
+        client_reasoning = get_client('google', reasoning_model)
         print(f"Model loaded: {reasoning_model}")
     except Exception as e:
         print(f"ERROR: Failed to initialize LLM client: {e}")
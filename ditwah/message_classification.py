@@ -0,0 +1,289 @@
+"""
+Description:
+    This script performs automated classification of text messages using a 
+    Large Language Model (LLM). It reads messages from a text file and 
+    classifies each message based on three key attributes. 
+
+Input:
+    - Text file containing messages (one per line)
+    - Location: data/Sample Messages.txt
+
+Output:
+    - Excel file: output/classified_messages.xlsx
+    - Columns: District, Intent, Priority
+"""
+
+import sys
+import os
+import re
+import csv
+import asyncio
+from openpyxl import Workbook
+
+from ditwah import DATA_DIR, OUTPUT_DIR
+from utils.prompts import render
+from utils.llm_client import get_client
+from utils.llm_cache import acached_chat
+from utils.retry_utils import retry_delay
+from utils.router import pick_model
+from utils.config_loader import get_max_concurrency
+from utils.examples import examples
+
+# Configuration
+INPUT_FILE = str(DATA_DIR / 'Sample Messages.txt')
+OUTPUT_FILE = str(OUTPUT_DIR / 'classified_messages.xlsx')
+CHECKPOINT_FILE = OUTPUT_FILE.replace('.xlsx', '.part.csv')
+CHECKPOINT_EVERY = 100  # messages per checkpoint flush
+COLUMNS = ['District', 'Intent', 'Priority']
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0  # seconds, doubled per attempt with jitter
+MAX_CONCURRENCY = get_max_concurrency()  # in-flight LLM requests
+
+# Valid values for validation
+VALID_INTENTS = ['Info', 'Rescue', 'Supply', 'Other', 'None']
+VALID_PRIORITIES = ['High', 'Low', 'None']
+
+# The few-shot prompt is identical for every message apart from the query,
+# so render it once and splice each message in with string concatenation
+_QUERY_PLACEHOLDER = '__QUERY__'
+_PROMPT_TEXT, _SPEC = render(
+    'few_shot.v1',
+    role='message classifier',
+    examples=examples,
+    query=_QUERY_PLACEHOLDER,
+    constraints='Follow the pattern in examples: provide District: [Name] | Intent: [Category] | Priority: [High/Low], If any field is not applicable, use None. Do not add any explanations. Intent should be one of [Info, Rescue, Supply, Other].',
+    format='District: {{district}} | Intent: {{intent}} | Priority: {{priority}}'
+)
+_PROMPT_HEAD, _PROMPT_TAIL = _PROMPT_TEXT.split(_QUERY_PLACEHOLDER, 1)
+
+# Expected response format: District: X | Intent: Y | Priority: Z
+_RESPONSE_RE = re.compile(r'District:\s*\w+.*\|\s*Intent:\s*\w+.*\|\s*Priority:\s*\w+', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_message(text):
+    """Fold case and whitespace so forwarded copies of a message compare equal."""
+    return _WHITESPACE_RE.sub(' ', text.lower())
+
+
+def validate_response(response_text):
+    """Validate that the LLM response matches expected format."""
+    if not response_text:
+        return False, "Empty response"
+    
+    if not _RESPONSE_RE.search(response_text):
+        return False, "Response doesn't match expected format"
+    
+    return True, None
+
+
+def build_messages(text):
+    """Build the few-shot classification prompt for a single message."""
+    prompt_text = _PROMPT_HEAD + f'Review: {text}' + _PROMPT_TAIL
+    return [{'role': 'user', 'content': prompt_text}]
+
+
+async def classify_async(text, client, sem):
+    """Classify a message with retry logic and error handling.
+
+    The semaphore is held only for the duration of the API call, so a
+    message waiting out its retry delay does not block other messages.
+    """
+    messages = build_messages(text)
+    
+    # Retry logic for API calls
+    last_error = None
+    for attempt in range(MAX_RETRIES):
+        try:
+            # Each attempt is cached separately so a re-run replays the
+            # same sequence of responses without touching the network;
+            # replies in the wrong format are never stored
+            async with sem:
+                response = await acached_chat(
+                    client, messages, cache=True, nonce=attempt,
+                    accept=lambda text: validate_response(text)[0], temperature=0.2
+                )
+            result = response.get('text')
+            
+            if result is not None:
+                # Validate response format
+                is_valid, error_msg = validate_response(result)
+                if is_valid:
+                    return result, None
+                else:
+                    last_error = error_msg
+            else:
+                last_error = "LLM returned None"
+                
+            if attempt < MAX_RETRIES - 1:
+                print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] {last_error}, retrying...")
+                await asyncio.sleep(retry_delay(attempt, base=RETRY_BASE_DELAY))
+                
+        except Exception as e:
+            last_error = str(e)
+            if attempt < MAX_RETRIES - 1:
+                print(f"    [Retry {attempt + 1}/{MAX_RETRIES}] API error: {last_error[:50]}...")
+                await asyncio.sleep(retry_delay(attempt, e, base=RETRY_BASE_DELAY))
+    
+    return None, last_error
+
+
+def result_to_row(result):
+    """Turn 'District: X | Intent: Y | Priority: Z' into a row in COLUMNS order."""
+    fields = {}
+    for part in result.split('|'):
+        key, _, value = part.partition(':')
+        fields[key.strip()] = value.strip()
+    return [fields.get(col) for col in COLUMNS]
+
+
+def ensure_output_directory(output_path):
+    """Create output directory if it doesn't exist."""
+    output_dir = os.path.dirname(output_path)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+        print(f"Created output directory: {output_dir}")
+
+
+async def main_async():
+    """Main function with comprehensive error handling."""
+    
+    print("\n" + "=" * 60)
+    print("MESSAGE CLASSIFICATION PIPELINE")
+    print("=" * 60)
+    
+    # Check if input file exists
+    if not os.path.exists(INPUT_FILE):
+        print(f"ERROR: Input file not found: {INPUT_FILE}")
+        print("Please ensure the file exists and the path is correct.")
+        sys.exit(1)
+    
+    # Ensure output directory exists
+    ensure_output_directory(OUTPUT_FILE)
+    
+    # Read the file with proper encoding handling
+    print(f"\nLoading messages from: {INPUT_FILE}")
+    try:
+        with open(INPUT_FILE, 'r', encoding='utf-8') as f:
+            raw_lines = f.read().splitlines()
+    except UnicodeDecodeError:
+        print("Warning: UTF-8 decoding failed, trying with latin-1 encoding...")
+        with open(INPUT_FILE, 'r', encoding='latin-1') as f:
+            raw_lines = f.read().splitlines()
+    except Exception as e:
+        print(f"ERROR: Could not read file: {e}")
+        sys.exit(1)
+    
+    # Drop empty lines up front so the processing loop only sees messages
+    lines = [line.strip() for line in raw_lines]
+    lines = [line for line in lines if line]
+    skip_count = len(raw_lines) - len(lines)
+    
+    # Handle empty file
+    if not lines:
+        print("WARNING: Input file is empty. Nothing to process.")
+        sys.exit(0)
+    
+    total_lines = len(lines)
+    print(f"Found {total_lines} messages to process\n")
+    
+    # Initialize the LLM client once and share it across all requests
+    try:
+        model = pick_model('google', 'reason')
+        client = get_client('google', model)
+    except Exception as e:
+        print(f"ERROR: Failed to initialize LLM client: {e}")
+        sys.exit(1)
+    
+    print("-" * 60)
+    
+    # Progress tracking
+    success_count = 0
+    error_count = 0
+    duplicate_count = 0
+    
+    # Rows are streamed into a write-only workbook as results arrive. Such a
+    # workbook can only be saved once, so crash safety comes from a CSV
+    # checkpoint that is appended to and flushed every CHECKPOINT_EVERY rows.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(COLUMNS)
+    checkpoint = open(CHECKPOINT_FILE, 'w', newline='', encoding='utf-8')
+    checkpoint_writer = csv.writer(checkpoint)
+    checkpoint_writer.writerow(COLUMNS)
+    tasks = []
+    
+    try:
+        print(f"Classifying {total_lines} messages ({MAX_CONCURRENCY} concurrent requests max)...\n")
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
+        
+        # Schedule every distinct message up front; the semaphore bounds in-flight
+        # requests, so one slow message never stalls the ones queued behind it.
+        # Repeated/forwarded messages share the task of their first occurrence.
+        unique_tasks = {}
+        for text in lines:
+            key = normalize_message(text)
+            if key not in unique_tasks:
+                unique_tasks[key] = asyncio.ensure_future(classify_async(text, client, sem))
+        tasks = [unique_tasks[normalize_message(text)] for text in lines]
+        duplicate_count = total_lines - len(unique_tasks)
+        if duplicate_count:
+            print(f"Skipping {duplicate_count} duplicate messages (results reused)\n")
+        
+        # Consume results in input order while later requests keep running
+        for i, (text, task) in enumerate(zip(lines, tasks), 1):
+            result, error = await task
+            print(f"[{i}/{total_lines}] Processing: {text[:50]}{'...' if len(text) > 50 else ''}")
+            
+            if result is None:
+                error_count += 1
+                print(f"          ERROR: {error}")
+            else:
+                print(f"          Result: {result}")
+                row = result_to_row(result)
+                ws.append(row)
+                checkpoint_writer.writerow(row)
+                success_count += 1
+            
+            if i % CHECKPOINT_EVERY == 0:
+                checkpoint.flush()
+    
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\n\n" + "=" * 60)
+        print("INTERRUPTED BY USER (Ctrl+C)")
+        print("=" * 60)
+        print(f"Partial results saved to: {OUTPUT_FILE}")
+        for task in tasks:
+            task.cancel()
+    
+    checkpoint.close()
+    
+    # Save the workbook once; the checkpoint is only kept if that fails
+    try:
+        if success_count:
+            wb.save(OUTPUT_FILE)
+        os.remove(CHECKPOINT_FILE)
+    except Exception as e:
+        print(f"ERROR saving results: {e}")
+        print(f"Rows collected so far are in: {CHECKPOINT_FILE}")
+    
+    # Print summary
+    print("\n" + "=" * 60)
+    print("PROCESSING COMPLETE")
+    print("=" * 60)
+    print(f"  Total messages:    {total_lines}")
+    print(f"  Successfully processed: {success_count}")
+    print(f"  Skipped (empty):   {skip_count}")
+    print(f"  Duplicates reused: {duplicate_count}")
+    print(f"  Errors:            {error_count}")
+    print(f"\n  Output saved to: {OUTPUT_FILE}")
+    print("=" * 60 + "\n")
+
+
+def main():
+    """Run the async classification pipeline."""
+    asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
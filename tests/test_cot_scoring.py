@@ -0,0 +1,53 @@
+"""Tests for the local CoT score parser in ditwah.cot_scoring."""
+
+import pytest
+
+from ditwah.cot_scoring import DEFAULT_SCORE, extract_numeric_score, parse_score_locally
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Reasoning...\nFINAL_SCORE: 10", "10"),
+    ("Reasoning...\n**FINAL_SCORE:** 10", "10"),
+    ("Reasoning...\nFINAL_SCORE: **10**", "10"),
+    ("Reasoning...\nFinal Score: **10**", "10"),
+    ("Reasoning...\n__Final score__: 8", "8"),
+    ("final_score:7", "7"),
+])
+def test_marker_formats(text, expected):
+    assert parse_score_locally(text) == expected
+
+
+def test_marker_wins_over_earlier_numbers():
+    text = "Base score: 5\nAge 72 adds 2\nFINAL_SCORE: 7"
+    assert parse_score_locally(text) == "7"
+
+
+def test_last_marker_wins():
+    text = "Draft: FINAL_SCORE: 5\nThe caller is 72, add 2; rescue needed, add 3.\nFINAL_SCORE: 10"
+    assert parse_score_locally(text) == "10"
+
+
+def test_loose_fallback_prefers_last_in_range_candidate():
+    text = "Start with score 5, add 3 for rescue.\nAnswer: **8**"
+    assert parse_score_locally(text) == "8"
+
+
+def test_loose_fallback_skips_out_of_range():
+    assert parse_score_locally("Answer: 42") is None
+
+
+def test_no_score():
+    assert parse_score_locally("Unable to analyze") is None
+
+
+@pytest.mark.parametrize("score_text, expected", [
+    ("10", 10),
+    (" 0 ", 0),
+    ("15", 15),
+    ("16", DEFAULT_SCORE),
+    ("none", DEFAULT_SCORE),
+    ("", DEFAULT_SCORE),
+    (None, DEFAULT_SCORE),
+])
+def test_extract_numeric_score(score_text, expected):
+    assert extract_numeric_score(score_text) == expected
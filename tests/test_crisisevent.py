@@ -0,0 +1,73 @@
+"""Tests for record validation in ditwah.Crisisevent."""
+
+import json
+
+import pytest
+
+from ditwah.Crisisevent import is_valid_record, validate_event, validate_events
+
+
+VALID = {
+    "district": "Colombo",
+    "flood_level_meters": 2.5,
+    "vicLm_count": 3,
+    "main_need": "Boats",
+    "status": "Critical",
+}
+
+
+def test_valid_record():
+    event, error = validate_event(VALID)
+    assert error is None
+    assert event == {
+        "district": "Colombo",
+        "flood_level_meters": 2.5,
+        "victim_count": 3,
+        "main_need": "Boats",
+        "status": "Critical",
+    }
+
+
+def test_defaults_for_missing_optional_fields():
+    event, error = validate_event({"district": "Kandy", "status": "Stable"})
+    assert error is None
+    assert event["flood_level_meters"] is None
+    assert event["victim_count"] == 0
+
+
+def test_nothing_to_validate():
+    assert validate_event(None) == (None, None)
+
+
+@pytest.mark.parametrize("district", ["Atlantis", "colombo", None, ["Kandy"], {"name": "Kandy"}, 5])
+def test_bad_district(district):
+    event, error = validate_event({**VALID, "district": district})
+    assert event is None
+    field, msg, details = error
+    assert field == "district"
+    assert json.loads(details)[0]["input"] == district
+
+
+def test_bad_status():
+    event, error = validate_event({**VALID, "status": "Bad"})
+    assert event is None
+    assert error[0] == "status"
+
+
+def test_bad_type():
+    event, error = validate_event({**VALID, "vicLm_count": "many"})
+    assert event is None
+    assert error[0] == "vicLm_count"
+
+
+def test_validate_events_keeps_order():
+    results = validate_events([VALID, None, {**VALID, "district": ["Kandy"]}])
+    assert results[0][1] is None
+    assert results[1] == (None, None)
+    assert results[2][1][0] == "district"
+
+
+def test_is_valid_record():
+    assert is_valid_record(VALID)
+    assert not is_valid_record(None)
+    assert not is_valid_record({**VALID, "district": ["Kandy"]})
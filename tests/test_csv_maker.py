@@ -0,0 +1,102 @@
+"""Tests for read_text_file in utils.csv_maker."""
+
+import pandas as pd
+import pytest
+
+from utils import csv_maker
+from utils.csv_maker import read_text_file
+
+
+def test_key_value_lines():
+    df = read_text_file([
+        "District: Colombo | Intent: Rescue | Priority: High",
+        "District: Kandy | Priority: Low",
+    ])
+    assert list(df.columns) == ["District", "Intent", "Priority"]
+    assert df.iloc[0].tolist() == ["Colombo", "Rescue", "High"]
+    assert df.loc[1, "District"] == "Kandy"
+    assert pd.isna(df.loc[1, "Intent"])
+
+
+def test_key_value_single_string():
+    df = read_text_file("District: Matale | Intent: Rescue")
+    assert df.to_dict("records") == [{"District": "Matale", "Intent": "Rescue"}]
+
+
+def test_key_value_repeated_key_keeps_last():
+    df = read_text_file("District: Galle | District: Matara")
+    assert df.loc[0, "District"] == "Matara"
+
+
+def test_key_value_without_colon_uses_part_as_value():
+    df = read_text_file("Colombo | Intent: Info")
+    assert df.loc[0, "Colombo"] == "Colombo"
+    assert df.loc[0, "Intent"] == "Info"
+
+
+def test_key_value_value_keeps_later_colons():
+    df = read_text_file("Time: 10:30 | Area: Kandy")
+    assert df.loc[0, "Time"] == "10:30"
+
+
+def test_key_value_explicit_columns():
+    df = read_text_file(["Intent: Info | District: Kandy | X: 1"], columns=["District", "Intent"])
+    assert list(df.columns) == ["District", "Intent"]
+    assert df.iloc[0].tolist() == ["Kandy", "Info"]
+
+
+def test_table_with_header():
+    df = read_text_file(["ID | Area | People", "1 | Kandy | 4", "2 | Galle", "3 | Jaffna | 2 | extra"], has_header=True)
+    assert list(df.columns) == ["ID", "Area", "People"]
+    assert df.iloc[0].tolist() == ["1", "Kandy", "4"]
+    assert pd.isna(df.loc[1, "People"])
+    assert df.iloc[2].tolist() == ["3", "Jaffna", "2"]
+
+
+def test_table_header_only():
+    df = read_text_file(["ID | Area"], has_header=True)
+    assert list(df.columns) == ["ID", "Area"]
+    assert df.empty
+
+
+@pytest.mark.parametrize("value", [None, "", []])
+def test_empty_input(value):
+    assert read_text_file(value, columns=["A"]).columns.tolist() == ["A"]
+
+
+@pytest.mark.parametrize("threshold", [None, 0])
+def test_file_input(tmp_path, monkeypatch, threshold):
+    # threshold=0 forces the mmap path for any non-empty file
+    if threshold is not None:
+        monkeypatch.setattr(csv_maker, "MMAP_THRESHOLD", threshold)
+    path = tmp_path / "input.txt"
+    path.write_text("ID | Area\r\n\n1 | Kandy  \n2 | Galle\n", encoding="utf-8")
+
+    df = read_text_file(str(path), has_header=True)
+    assert df.to_dict("records") == [{"ID": "1", "Area": "Kandy"}, {"ID": "2", "Area": "Galle"}]
+
+
+def test_csv_append_writes_header_once(tmp_path):
+    out = tmp_path / "out.csv"
+    read_text_file("District: Colombo | Intent: Rescue", output_file=str(out))
+    read_text_file("District: Kandy | Intent: Info", output_file=str(out))
+
+    df = pd.read_csv(out)
+    assert df.to_dict("records") == [
+        {"District": "Colombo", "Intent": "Rescue"},
+        {"District": "Kandy", "Intent": "Info"},
+    ]
+
+
+def test_xlsx_append_aligns_columns_by_name(tmp_path):
+    out = tmp_path / "out.xlsx"
+    read_text_file("District: Colombo | Intent: Rescue", output_file=str(out))
+    read_text_file("X: 1 | Intent: Info | District: Kandy", output_file=str(out))
+    read_text_file("District: Galle", output_file=str(out))
+
+    df = pd.read_excel(out)
+    assert list(df.columns) == ["District", "Intent", "X"]
+    assert df["District"].tolist() == ["Colombo", "Kandy", "Galle"]
+    assert df.loc[1, "Intent"] == "Info"
+    assert df.loc[1, "X"] == 1
+    assert pd.isna(df.loc[0, "X"])
@@ -0,0 +1,84 @@
+"""Tests for batch prompt building and reply splitting in ditwah.extract_json."""
+
+import json
+
+import pytest
+
+from ditwah.extract_json import build_batch_messages, fill_missing, split_batch_response
+
+
+def reply(*objects):
+    return json.dumps(list(objects))
+
+
+def test_build_batch_messages_numbers_texts():
+    messages, spec = build_batch_messages(["flood in Colombo", "landslide in Kandy"])
+    content = messages[0]["content"]
+    assert messages[0]["role"] == "user"
+    assert "1. flood in Colombo\n2. landslide in Kandy" in content
+    assert "exactly 2 objects" in content
+    assert "__TEXT__" not in content and "__COUNT__" not in content
+    assert spec.id == "json_extract_batch.v1"
+
+
+def test_split_places_by_index():
+    items, error = split_batch_response(reply({"index": 2, "district": "Kandy"}, {"index": 1, "district": "Galle"}), 2)
+    assert error is None
+    assert items == [{"district": "Galle"}, {"district": "Kandy"}]
+
+
+def test_split_falls_back_to_position():
+    items, _ = split_batch_response(reply({"district": "Galle"}, {"district": "Kandy"}), 2)
+    assert items == [{"district": "Galle"}, {"district": "Kandy"}]
+
+
+def test_split_accepts_numeric_string_index():
+    items, _ = split_batch_response(reply({"index": "2", "district": "Kandy"}), 2)
+    assert items == [None, {"district": "Kandy"}]
+
+
+@pytest.mark.parametrize("index", [0, 3, -1, "two", 1.5, True, None])
+def test_split_drops_unusable_index(index):
+    items, error = split_batch_response(reply({"index": index, "district": "Kandy"}), 2)
+    assert error is None
+    assert items == [None, None]
+
+
+def test_split_short_array_leaves_gaps():
+    items, _ = split_batch_response(reply({"index": 1, "district": "Galle"}), 3)
+    assert items == [{"district": "Galle"}, None, None]
+
+
+def test_split_ignores_extra_and_non_object_entries():
+    items, _ = split_batch_response(reply("junk", {"district": "Kandy"}, {"district": "Galle"}), 2)
+    assert items == [None, {"district": "Kandy"}]
+
+
+def test_split_strips_code_fences():
+    items, _ = split_batch_response("```json\n" + reply({"district": "Galle"}) + "\n```", 1)
+    assert items == [{"district": "Galle"}]
+
+
+def test_split_rejects_invalid_json():
+    items, error = split_batch_response("[{not json", 1)
+    assert items is None
+    assert error.startswith("Invalid JSON")
+
+
+def test_split_rejects_non_array():
+    items, error = split_batch_response(json.dumps({"district": "Galle"}), 1)
+    assert items is None
+    assert error == "Expected a JSON array"
+
+
+def test_fill_missing():
+    cached = [{"a": 1}, None, {"c": 3}, None]
+    assert fill_missing(cached, [{"b": 2}, None]) == [{"a": 1}, {"b": 2}, {"c": 3}, None]
+
+
+def test_fill_missing_short_fresh_list():
+    assert fill_missing([None, None], [{"a": 1}]) == [{"a": 1}, None]
+
+
+def test_fill_missing_all_cached():
+    assert fill_missing([{"a": 1}], []) == [{"a": 1}]
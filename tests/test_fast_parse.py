@@ -0,0 +1,58 @@
+"""Tests for the optional fast parsers in utils.fast_parse and utils.json_utils."""
+
+import json
+
+import pytest
+
+from utils import fast_parse
+from utils.json_utils import fast_dumps, fast_loads
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("10", 10),
+    ("score is 7 out of 15", 7),
+    ("0", 0),
+    ("15", 15),
+    ("16", -1),
+    ("100", -1),
+    ("no digits", -1),
+    ("", -1),
+    ("12 then 3", 12),
+])
+def test_fast_first_score(text, expected):
+    if not fast_parse.HAS_NUMBA:
+        assert fast_parse.fast_first_score(text) is None
+    else:
+        assert fast_parse.fast_first_score(text) == expected
+
+
+def test_fast_first_score_skips_non_ascii():
+    assert fast_parse.fast_first_score("ලකුණු 10") is None
+
+
+@pytest.mark.skipif(not fast_parse.HAS_NUMBA, reason="numba not installed")
+def test_scanner_matches_regex_path():
+    import re
+
+    import numpy as np
+
+    for text in ["a1b2", "x 05 y", "score: 14.", "99", "3"]:
+        numbers = re.findall(r"\d+", text)
+        expected = int(numbers[0]) if numbers and int(numbers[0]) <= 15 else -1
+        buf = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        assert fast_parse.first_int_0_15(buf) == expected
+
+
+def test_fast_json_roundtrip():
+    record = {"district": "Colombo", "flood_level_meters": 2.5, "vicLm_count": 3, "main_need": None}
+    assert fast_loads(fast_dumps(record)) == record
+    assert json.loads(fast_dumps(record)) == record
+
+
+def test_fast_loads_accepts_bytes():
+    assert fast_loads(b'[1, 2]') == [1, 2]
+
+
+def test_fast_loads_raises_json_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        fast_loads("{not json")
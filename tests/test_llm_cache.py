@@ -0,0 +1,141 @@
+"""Tests for the on-disk LLM response cache in utils.llm_cache."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from utils import config_loader, llm_cache
+
+
+MESSAGES = [{"role": "user", "content": "Classify: flood in Colombo"}]
+
+
+class FakeClient:
+    """Stands in for LLMClient; returns canned texts and counts calls."""
+
+    provider = "google"
+    model = "test-model"
+
+    def __init__(self, *texts):
+        self.texts = list(texts) or ["reply"]
+        self.calls = 0
+
+    def _next(self):
+        text = self.texts[min(self.calls, len(self.texts) - 1)]
+        self.calls += 1
+        return {"text": text, "texts": [text], "meta": {"cache_hit": False}}
+
+    def chat(self, messages, **kwargs):
+        return self._next()
+
+    async def achat(self, messages, **kwargs):
+        return self._next()
+
+
+@pytest.fixture
+def cache_db(tmp_path, monkeypatch):
+    """Point the cache at a fresh database and enable caching."""
+    monkeypatch.setattr(llm_cache, "_get_cache_path", lambda: tmp_path / "cache.sqlite")
+    monkeypatch.setattr(llm_cache, "_conn", None)
+    monkeypatch.setattr(config_loader, "is_cache_enabled", lambda: True)
+    yield
+    if llm_cache._conn is not None:
+        llm_cache._conn.close()
+
+
+def test_make_key_is_stable():
+    client = SimpleNamespace(provider="google", model="m")
+    assert llm_cache.make_key(client, MESSAGES, 0, 100) == llm_cache.make_key(client, MESSAGES, 0, 100)
+
+
+@pytest.mark.parametrize("change", [
+    {"temperature": 0.5},
+    {"max_tokens": 200},
+    {"nonce": 1},
+    {"n": 3},
+    {"messages": [{"role": "user", "content": "Classify: flood in Kandy"}]},
+])
+def test_make_key_depends_on_request(change):
+    client = SimpleNamespace(provider="google", model="m")
+    base = dict(messages=MESSAGES, temperature=0, max_tokens=100, nonce=None, n=1)
+    assert llm_cache.make_key(client, **base) != llm_cache.make_key(client, **{**base, **change})
+
+
+def test_make_key_depends_on_model():
+    a = SimpleNamespace(provider="google", model="m1")
+    b = SimpleNamespace(provider="google", model="m2")
+    assert llm_cache.make_key(a, MESSAGES) != llm_cache.make_key(b, MESSAGES)
+
+
+def test_make_item_key():
+    assert llm_cache.make_item_key("ns", "line") == llm_cache.make_item_key("ns", "line")
+    assert llm_cache.make_item_key("ns", "line") != llm_cache.make_item_key("ns2", "line")
+    assert llm_cache.make_item_key("ns", "line") != llm_cache.make_item_key("ns", "line 2")
+
+
+def test_put_and_get_roundtrip(cache_db):
+    key = llm_cache.make_item_key("ns", "line")
+    assert llm_cache.get_cached(key) is None
+
+    llm_cache.put_cached(key, {"text": "hello"})
+    hit = llm_cache.get_cached(key)
+    assert hit["text"] == "hello"
+    assert hit["texts"] == ["hello"]
+    assert hit["meta"]["cache_hit"] is True
+
+
+def test_responses_without_text_are_not_stored(cache_db):
+    key = llm_cache.make_item_key("ns", "line")
+    llm_cache.put_cached(key, {"text": None})
+    assert llm_cache.get_cached(key) is None
+
+
+def test_deterministic_calls_are_cached(cache_db):
+    client = FakeClient("first", "second")
+    assert llm_cache.cached_chat(client, MESSAGES, temperature=0)["text"] == "first"
+    hit = llm_cache.cached_chat(client, MESSAGES, temperature=0)
+    assert hit["text"] == "first"
+    assert hit["meta"]["cache_hit"] is True
+    assert client.calls == 1
+
+
+def test_sampled_calls_are_not_cached_by_default(cache_db):
+    client = FakeClient("first", "second")
+    llm_cache.cached_chat(client, MESSAGES, temperature=1.0)
+    assert llm_cache.cached_chat(client, MESSAGES, temperature=1.0)["text"] == "second"
+    assert client.calls == 2
+
+
+def test_sampled_calls_cache_when_forced(cache_db):
+    client = FakeClient("first", "second")
+    llm_cache.cached_chat(client, MESSAGES, cache=True, temperature=1.0)
+    assert llm_cache.cached_chat(client, MESSAGES, cache=True, temperature=1.0)["text"] == "first"
+
+
+def test_cache_disabled_in_config(cache_db, monkeypatch):
+    monkeypatch.setattr(config_loader, "is_cache_enabled", lambda: False)
+    client = FakeClient("first", "second")
+    llm_cache.cached_chat(client, MESSAGES, temperature=0)
+    assert llm_cache.cached_chat(client, MESSAGES, temperature=0)["text"] == "second"
+
+
+def test_rejected_responses_are_not_stored(cache_db):
+    client = FakeClient("bad", "good", "other")
+    accept = lambda text: text != "bad"
+
+    assert llm_cache.cached_chat(client, MESSAGES, accept=accept, temperature=0)["text"] == "bad"
+    assert llm_cache.cached_chat(client, MESSAGES, accept=accept, temperature=0)["text"] == "good"
+    assert llm_cache.cached_chat(client, MESSAGES, accept=accept, temperature=0)["text"] == "good"
+    assert client.calls == 2
+
+
+def test_async_cached_chat(cache_db):
+    client = FakeClient("first", "second")
+
+    async def run():
+        await llm_cache.acached_chat(client, MESSAGES, temperature=0)
+        return await llm_cache.acached_chat(client, MESSAGES, temperature=0)
+
+    assert asyncio.run(run())["text"] == "first"
+    assert client.calls == 1
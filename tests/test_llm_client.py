@@ -0,0 +1,134 @@
+"""Tests for response parsing and batch result alignment in utils.llm_client."""
+
+import json
+from types import SimpleNamespace as NS
+
+import pytest
+
+from utils.llm_client import LLMClient
+
+
+def make_client(provider, sdk):
+    """Build an LLMClient around a fake provider SDK without API keys."""
+    client = LLMClient.__new__(LLMClient)
+    client.provider = provider
+    client.model = "test-model"
+    client.client = sdk
+    return client
+
+
+# --- _parse_completion / _parse_google ---------------------------------------
+
+def completion(*contents, usage=None):
+    return NS(choices=[NS(message=NS(content=c)) for c in contents], usage=usage)
+
+
+def test_parse_completion_single_choice():
+    usage = NS(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+    parsed = LLMClient._parse_completion(completion("hello", usage=usage))
+    assert parsed["text"] == "hello"
+    assert parsed["texts"] == ["hello"]
+    assert parsed["usage"]["total_tokens"] == 15
+
+
+def test_parse_completion_several_choices():
+    parsed = LLMClient._parse_completion(completion("a", None, "c"))
+    assert parsed["text"] == "a"
+    assert parsed["texts"] == ["a", "", "c"]
+    assert parsed["usage"]["prompt_tokens"] is None
+
+
+def candidate(*texts):
+    parts = [NS(text=t) for t in texts]
+    return NS(content=NS(parts=parts))
+
+
+def test_parse_google_one_text_per_candidate():
+    response = NS(
+        text="first",
+        candidates=[candidate("fir", "st"), candidate("second"), NS(content=None), candidate(None)],
+        usage_metadata=NS(prompt_token_count=7, candidates_token_count=3),
+    )
+    parsed = LLMClient._parse_google(response)
+    assert parsed["text"] == "first"
+    assert parsed["texts"] == ["first", "second", None, None]
+    assert parsed["usage"] == {"promptTokenCount": 7, "candidatesTokenCount": 3}
+
+
+def test_parse_google_no_candidates():
+    parsed = LLMClient._parse_google(NS(text=None, candidates=None, usage_metadata=None))
+    assert parsed["texts"] == []
+    assert parsed["usage"] == {}
+
+
+# --- get_batch_results ------------------------------------------------------
+
+def google_client(state, responses=None):
+    job = NS(state=NS(name=state), dest=NS(inlined_responses=responses))
+    return make_client("google", NS(batches=NS(get=lambda name: job)))
+
+
+@pytest.mark.parametrize("state", [
+    "JOB_STATE_PENDING", "JOB_STATE_QUEUED", "JOB_STATE_RUNNING",
+    "JOB_STATE_UPDATING", "JOB_STATE_PAUSED", "JOB_STATE_CANCELLING",
+])
+def test_google_batch_still_running(state):
+    assert google_client(state).get_batch_results("job") is None
+
+
+def test_google_batch_results_in_request_order():
+    responses = [NS(response=NS(text="a")), NS(response=None), NS(response=NS(text="c"))]
+    assert google_client("JOB_STATE_SUCCEEDED", responses).get_batch_results("job") == ["a", None, "c"]
+
+
+def test_google_partially_succeeded_keeps_results():
+    responses = [NS(response=None), NS(response=NS(text="b"))]
+    assert google_client("JOB_STATE_PARTIALLY_SUCCEEDED", responses).get_batch_results("job") == [None, "b"]
+
+
+@pytest.mark.parametrize("state", ["JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"])
+def test_google_batch_failed(state):
+    with pytest.raises(RuntimeError):
+        google_client(state).get_batch_results("job")
+
+
+def openai_client(status, lines=(), total=None):
+    job = NS(
+        status=status,
+        output_file_id="file-out" if lines else None,
+        request_counts=NS(total=total) if total is not None else None,
+    )
+    content = NS(text="\n".join(json.dumps(line) for line in lines))
+    sdk = NS(
+        batches=NS(retrieve=lambda job_id: job),
+        files=NS(content=lambda file_id: content),
+    )
+    return make_client("openai", sdk)
+
+
+def output_line(index, text):
+    choices = [{"message": {"content": text}}] if text is not None else []
+    return {"custom_id": f"request-{index}", "response": {"body": {"choices": choices}}}
+
+
+@pytest.mark.parametrize("status", ["validating", "in_progress", "finalizing", "cancelling"])
+def test_openai_batch_still_running(status):
+    assert openai_client(status).get_batch_results("job") is None
+
+
+def test_openai_batch_results_aligned_by_custom_id():
+    # The output file is not in request order and omits request-1 (it failed)
+    lines = [output_line(2, "c"), output_line(0, "a"), output_line(3, None)]
+    results = openai_client("completed", lines, total=4).get_batch_results("job")
+    assert results == ["a", None, "c", None]
+
+
+def test_openai_batch_without_counts_uses_output():
+    results = openai_client("completed", [output_line(1, "b"), output_line(0, "a")]).get_batch_results("job")
+    assert results == ["a", "b"]
+
+
+@pytest.mark.parametrize("status", ["failed", "expired", "cancelled"])
+def test_openai_batch_failed(status):
+    with pytest.raises(RuntimeError):
+        openai_client(status).get_batch_results("job")
@@ -0,0 +1,55 @@
+"""Tests for the async token bucket in utils.rate_limit."""
+
+import asyncio
+import time
+
+import pytest
+
+from utils.rate_limit import AsyncRateLimiter
+
+
+def test_burst_up_to_rate_is_immediate():
+    async def run():
+        limiter = AsyncRateLimiter(5, period=10.0)
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) < 0.05
+
+
+def test_waits_for_refill_once_empty():
+    async def run():
+        limiter = AsyncRateLimiter(2, period=0.4)  # one token every 0.2s
+        await limiter.acquire()
+        await limiter.acquire()
+        start = time.monotonic()
+        async with limiter:
+            pass
+        return time.monotonic() - start
+
+    assert 0.15 <= asyncio.run(run()) < 0.5
+
+
+def test_concurrent_acquires_are_spaced():
+    async def run():
+        limiter = AsyncRateLimiter(1, period=0.1)
+        starts = []
+
+        async def worker():
+            async with limiter:
+                starts.append(time.monotonic())
+
+        await asyncio.gather(*(worker() for _ in range(4)))
+        return starts
+
+    starts = sorted(asyncio.run(run()))
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert all(gap >= 0.08 for gap in gaps)
+
+
+@pytest.mark.parametrize("rate", [0, -1])
+def test_rate_must_be_positive(rate):
+    with pytest.raises(ValueError):
+        AsyncRateLimiter(rate)
@@ -0,0 +1,86 @@
+"""Tests for the retry helpers in utils.retry_utils."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from utils.retry_utils import is_permanent_error, parse_retry_after, retry_delay
+
+
+class APIError(Exception):
+    """Provider-style error carrying an optional status and response."""
+
+    def __init__(self, message="", status_code=None, code=None, headers=None):
+        super().__init__(message)
+        if status_code is not None:
+            self.status_code = status_code
+        if code is not None:
+            self.code = code
+        if headers is not None:
+            self.response = SimpleNamespace(headers=headers)
+
+
+def test_retry_after_header():
+    assert parse_retry_after(APIError(status_code=429, headers={"retry-after": "7"})) == 7.0
+
+
+def test_bad_retry_after_header_falls_back_to_message():
+    error = APIError("Retry after 3s", status_code=429, headers={"retry-after": "soon"})
+    assert parse_retry_after(error) == 3.0
+
+
+@pytest.mark.parametrize("message, expected", [
+    ("Rate limited. Retry-After: 7", 7.0),
+    ("please retry after 2.5s", 2.5),
+    ("429 RESOURCE_EXHAUSTED {'retryDelay': '12s'}", 12.0),
+])
+def test_retry_after_in_message(message, expected):
+    assert parse_retry_after(APIError(message)) == expected
+
+
+def test_no_retry_after():
+    assert parse_retry_after(APIError("Internal server error")) is None
+
+
+def test_retry_delay_honours_retry_after():
+    assert retry_delay(0, APIError("retry after 9s"), base=1.0, cap=30) == 9.0
+
+
+@pytest.mark.parametrize("attempt", [0, 1, 2, 3, 6])
+def test_retry_delay_backoff_with_jitter(attempt):
+    backoff = min(2.0 * 2 ** attempt, 10.0)
+    for _ in range(50):
+        delay = retry_delay(attempt, base=2.0, cap=10.0)
+        assert 0.5 * backoff <= delay < 1.5 * backoff
+
+
+def test_retry_delay_cap_from_config(monkeypatch):
+    from utils import config_loader
+
+    monkeypatch.setattr(config_loader, "get_backoff_max", lambda: 4.0)
+    assert retry_delay(10, base=1.0) < 1.5 * 4.0
+
+
+@pytest.mark.parametrize("status", [400, 401, 403, 404, 422])
+def test_permanent_statuses(status):
+    assert is_permanent_error(APIError(status_code=status))
+
+
+@pytest.mark.parametrize("status", [408, 429, 500, 503])
+def test_transient_statuses(status):
+    assert not is_permanent_error(APIError(status_code=status))
+
+
+def test_google_style_code_attribute():
+    assert is_permanent_error(APIError(code=403))
+    assert not is_permanent_error(APIError(code=429))
+
+
+@pytest.mark.parametrize("message", ["Invalid API key provided", "401 Unauthorized", "invalid_request_error"])
+def test_permanent_messages(message):
+    assert is_permanent_error(APIError(message))
+
+
+@pytest.mark.parametrize("message", ["Read timed out", "Invalid JSON: Expecting value"])
+def test_transient_messages(message):
+    assert not is_permanent_error(APIError(message))
@@ -8,7 +8,11 @@ This package provides:
 - router: automatic model selection for different techniques
 - prompts: centralized prompt template catalog
 - llm_client: unified provider abstraction with retry logic
+- llm_cache: on-disk response cache for repeated prompts
+- retry_utils: backoff/jitter and Retry-After helpers for retry loops
+- rate_limit: async token-bucket limiter for requests per minute
 - json_utils: JSON schema validation and repair
+- fast_parse: optional Numba-compiled numeric scanners
 """
 
 __version__ = "1.0.0"
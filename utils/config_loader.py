@@ -5,6 +5,7 @@ Loads configuration from config/config.yaml and provides easy access
 to settings throughout the application.
 """
 
+import os
 import yaml
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -149,11 +150,40 @@ def get_backoff_base() -> float:
     return get_config().get("retry.backoff.base_seconds", 0.5)
 
 
+def get_backoff_max() -> float:
+    """Get maximum backoff time in seconds (before jitter)."""
+    return get_config().get("retry.backoff.max_seconds", 30)
+
+
 def get_backoff_jitter() -> float:
     """Get backoff jitter factor."""
     return get_config().get("retry.backoff.jitter_factor", 0.25)
 
 
+def get_max_concurrency() -> int:
+    """
+    Get max number of concurrent async LLM requests.
+
+    The LLM_MAX_ASYNC environment variable overrides the config value.
+    """
+    env_value = os.getenv("LLM_MAX_ASYNC")
+    if env_value:
+        return int(env_value)
+    return get_config().get("concurrency.max_async", 20)
+
+
+def get_requests_per_minute() -> int:
+    """
+    Get the request start rate for rate-limited pipelines.
+
+    The LLM_RPM environment variable overrides the config value.
+    """
+    env_value = os.getenv("LLM_RPM")
+    if env_value:
+        return int(env_value)
+    return get_config().get("concurrency.requests_per_minute", 10)
+
+
 def get_default_temperature(task_type: Optional[str] = None) -> float:
     """
     Get default temperature for task type.
@@ -202,6 +232,16 @@ def get_log_path() -> Path:
     return Path(log_dir) / log_file
 
 
+def is_cache_enabled() -> bool:
+    """Check if on-disk LLM response caching is enabled."""
+    return get_config().get("development.cache_responses", False)
+
+
+def get_cache_path() -> str:
+    """Get path to the LLM response cache database."""
+    return get_config().get("development.cache_path", ".cache/llm_responses.sqlite")
+
+
 def should_auto_route_reasoning() -> bool:
     """Check if automatic reasoning model routing is enabled."""
     return get_config().get("models.auto_routing", True)
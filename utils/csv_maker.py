@@ -1,5 +1,19 @@
 import pandas as pd
 import os
+import mmap
+
+# Files larger than this are scanned through mmap instead of read() whole
+MMAP_THRESHOLD = 64 * 1024 * 1024  # bytes
+
+
+def _iter_file_lines(path):
+    """Yield stripped, non-empty lines from a memory-mapped file one at a time."""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for raw in iter(mm.readline, b''):
+            line = raw.decode('utf-8').strip()
+            if line:
+                yield line
+
 
 def read_text_file(string, separator='|', columns=None, output_file=None, has_header=False):
     """
@@ -11,7 +25,9 @@ def read_text_file(string, separator='|', columns=None, output_file=None, has_he
         string: Can be a single string, list of strings, or path to a text file
         separator: Delimiter between columns/key:value pairs (default: '|')
         columns: Optional column names (auto-extracted from keys or header if not provided)
-        output_file: Optional path to save as CSV or Excel file
+        output_file: Optional path to save as CSV or Excel file; existing files
+            are appended to. Each Excel append still loads and saves the whole
+            workbook, so use CSV for many incremental appends.
         has_header: If True, treats first line as column headers and rest as data values
     
     Example:
@@ -24,8 +40,15 @@ def read_text_file(string, separator='|', columns=None, output_file=None, has_he
     
     # Check if input is a file path
     if isinstance(string, str) and os.path.isfile(string):
-        with open(string, 'r', encoding='utf-8') as f:
-            lines = [line.strip() for line in f.readlines() if line.strip()]
+        if os.path.getsize(string) > MMAP_THRESHOLD:
+            # Large file: decode line by line from the page cache so the raw
+            # text never sits in memory alongside the parsed lines
+            lines = list(_iter_file_lines(string))
+        else:
+            # Small file: read in one call, split in C
+            with open(string, 'r', encoding='utf-8') as f:
+                lines = [line.strip() for line in f.read().splitlines()]
+            lines = [line for line in lines if line]
     # Handle single string input by wrapping in a list
     elif isinstance(string, str):
         lines = [string]
@@ -41,39 +64,35 @@ def read_text_file(string, separator='|', columns=None, output_file=None, has_he
         if columns is None:
             columns = [col.strip() for col in lines[0].split(separator)]
         
-        # Parse data lines (skip header)
-        data = []
-        for line in lines[1:]:
-            values = [val.strip() for val in line.split(separator)]
-            row = dict(zip(columns, values))
-            data.append(row)
-        
-        df = pd.DataFrame(data, columns=columns)
+        # Split all data lines at once (skip header); extra values are dropped
+        # and missing ones left empty, like zip() into a dict per row
+        if len(lines) > 1:
+            rows = pd.Series(lines[1:], dtype=object).str.split(separator, expand=True, regex=False)
+            rows = rows.iloc[:, :len(columns)].apply(lambda col: col.str.strip())
+            rows.columns = columns[:rows.shape[1]]
+            df = rows.reindex(columns=columns)
+        else:
+            df = pd.DataFrame(columns=columns)
     else:
-        # Key-value pair parsing (original behavior)
-        data = []
-        extracted_columns = None
+        # Key-value pair parsing: explode every line into its parts, split
+        # each part on the first ':' and pivot back to one row per line
+        parts = pd.Series(lines, dtype=object).str.split(separator, regex=False).explode().str.strip()
+        row_ids = parts.index.to_numpy()
+        parts = parts.reset_index(drop=True)
+        pairs = parts.str.split(':', n=1, expand=True)
+        keys = pairs[0].str.strip()
+        # If no colon, use the part as-is (fallback)
+        values = pairs[1].str.strip().fillna(parts) if 1 in pairs else parts
         
-        for line in lines:
-            parts = [part.strip() for part in line.strip().split(separator)]
-            row = {}
-            for part in parts:
-                if ':' in part:
-                    key, value = part.split(':', 1)
-                    row[key.strip()] = value.strip()
-                else:
-                    # If no colon, use the part as-is (fallback)
-                    row[part] = part
-            
-            # Extract column names from the first row if not provided
-            if extracted_columns is None:
-                extracted_columns = list(row.keys())
-            
-            data.append(row)
+        long_df = pd.DataFrame({'row': row_ids, 'key': keys, 'value': values})
+        # A repeated key in one line keeps its last value, as dict assignment did
+        long_df = long_df.drop_duplicates(['row', 'key'], keep='last')
+        wide = long_df.pivot(index='row', columns='key', values='value')
         
-        # Use provided columns or extracted columns
-        final_columns = columns if columns else extracted_columns
-        df = pd.DataFrame(data, columns=final_columns)
+        # Use provided columns or the keys of the first line, in order
+        final_columns = columns if columns else list(dict.fromkeys(keys[row_ids == 0]))
+        df = wide.reindex(index=range(len(lines)), columns=final_columns)
+        df = df.rename_axis(index=None, columns=None).reset_index(drop=True)
     
     if output_file:
         # Create parent directories if they don't exist
@@ -85,14 +104,30 @@ def read_text_file(string, separator='|', columns=None, output_file=None, has_he
         _, ext = os.path.splitext(output_file)
         
         if ext.lower() in ['.xlsx', '.xls']:
-            # Excel file - need to read existing, concat, and rewrite
             if file_exists:
-                existing_df = pd.read_excel(output_file)
-                df = pd.concat([existing_df, df], ignore_index=True)
-            df.to_excel(output_file, index=False)
+                # Write the new rows below the existing ones without parsing
+                # the sheet into a DataFrame. openpyxl still loads and saves
+                # the whole workbook, so each append costs O(file size);
+                # CSV output is the linear-time append path.
+                with pd.ExcelWriter(output_file, engine='openpyxl', mode='a', if_sheet_exists='overlay') as writer:
+                    sheet = writer.book.worksheets[0]
+                    # Rows are written by position, so line the columns up with
+                    # the sheet's header; new columns are added after it, as a
+                    # concat by column name would
+                    header = [cell.value for cell in sheet[1] if cell.value is not None]
+                    extra = [col for col in df.columns if col not in header]
+                    for offset, col in enumerate(extra, len(header) + 1):
+                        sheet.cell(row=1, column=offset, value=col)
+                    df.reindex(columns=header + extra).to_excel(
+                        writer, sheet_name=sheet.title, startrow=sheet.max_row, index=False, header=False
+                    )
+            else:
+                df.to_excel(output_file, index=False)
         else:
-            # CSV file - can append directly
-            df.to_csv(output_file, mode='a', index=False, header=not file_exists)
+            # CSV file - can append directly; render first so the append
+            # is a single write
+            with open(output_file, 'a', encoding='utf-8', newline='') as f:
+                f.write(df.to_csv(index=False, header=not file_exists))
     return df
 
 
@@ -0,0 +1,66 @@
+"""
+Fast numeric parsing helpers for bulk score extraction.
+
+Provides a Numba-compiled byte scanner for pulling the first small
+integer out of model output. Numba is optional (pip install .[fast]);
+when it is missing HAS_NUMBA is False and callers should fall back to
+their regex path.
+
+Only worth it for bulk scans of long text: on short strings (such as a
+score already isolated by a regex) the call overhead makes it slower
+than re.findall, and the first call pays the JIT compile.
+"""
+
+from typing import Optional
+
+try:
+    import numpy as np
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True, nogil=True)
+    def first_int_0_15(buf: "np.ndarray") -> int:
+        """
+        Scan ASCII bytes for the first run of digits.
+
+        Mirrors int(re.findall(r'\\d+', text)[0]) followed by a 0-15 range
+        check, without building intermediate strings.
+
+        Args:
+            buf: uint8 array of ASCII-encoded text
+
+        Returns:
+            The first integer if it is within 0-15, otherwise -1
+        """
+        value = -1
+        for i in range(buf.shape[0]):
+            b = buf[i]
+            if 48 <= b <= 57:
+                value = (0 if value < 0 else value) * 10 + (b - 48)
+                if value > 15:
+                    return -1
+            elif value >= 0:
+                break
+        return value
+
+
+def fast_first_score(text: str) -> Optional[int]:
+    """
+    Extract the first integer in 0-15 from text using the compiled scanner.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        Score in 0-15, -1 if no valid score was found, or None when the
+        fast path is unavailable (numba missing or non-ASCII input)
+    """
+    if not HAS_NUMBA or not text.isascii():
+        return None
+    return first_int_0_15(np.frombuffer(text.encode("ascii"), dtype=np.uint8))
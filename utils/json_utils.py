@@ -5,13 +5,39 @@ Provides tools to:
 - Validate JSON against schemas
 - Repair common JSON formatting errors
 - Extract JSON from mixed text
+- Parse/serialize quickly with orjson when it is installed (pip install .[fast])
 """
 
 import json
 import re
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple, Union
 from jsonschema import validate, ValidationError, Draft7Validator
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def fast_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON with orjson when available, else the stdlib parser.
+
+    Both raise a json.JSONDecodeError subclass on invalid input.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def fast_dumps(obj: Any) -> str:
+    """Serialize to a JSON string with orjson when available, else the stdlib."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
 
 def extract_json(text: str) -> Optional[str]:
     """
@@ -0,0 +1,250 @@
+"""
+On-disk response cache for LLM calls.
+
+Stores chat results in a small SQLite database keyed by a hash of
+(provider, model, messages, sampling parameters) so that re-running a
+pipeline with identical prompts does not go back to the network.
+
+Caching rules:
+- Deterministic calls (temperature == 0) are cached by default
+- Sampled calls (temperature > 0) are only cached with cache=True
+- A nonce keeps several samples of the same prompt as separate entries
+- make_item_key() caches per-input results of multi-input requests
+- An accept() check keeps responses that fail validation out of the cache
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .json_utils import fast_loads, fast_dumps
+
+
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.Lock()
+
+
+def _get_cache_path() -> Path:
+    """Get path to the cache database, creating its directory if needed."""
+    from .config_loader import get_cache_path
+
+    cache_path = Path(get_cache_path())
+
+    # Relative paths are resolved against the project root, like logs/
+    if not cache_path.is_absolute():
+        utils_dir = Path(__file__).parent
+        project_root = utils_dir.parent
+        cache_path = project_root / cache_path
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    return cache_path
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Open the cache database once and reuse the connection."""
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(_get_cache_path(), check_same_thread=False)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key BLOB PRIMARY KEY, response TEXT, ts INT)"
+        )
+        _conn.commit()
+    return _conn
+
+
+def make_key(
+    client: Any,
+    messages: List[Dict[str, str]],
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    nonce: Optional[Any] = None,
+    n: int = 1,
+) -> bytes:
+    """
+    Build the cache key for a chat request.
+
+    Args:
+        client: LLMClient instance (provider and model are part of the key)
+        messages: OpenAI-style messages array
+        temperature: Sampling temperature
+        max_tokens: Max completion tokens
+        nonce: Optional discriminator for storing several samples per prompt
+        n: Number of samples requested in one call
+
+    Returns:
+        SHA-256 digest of the request
+    """
+    payload = json.dumps(
+        {
+            "provider": client.provider,
+            "model": client.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "nonce": nonce,
+            "n": n,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).digest()
+
+
+def make_item_key(namespace: str, item: str) -> bytes:
+    """
+    Build the cache key for a per-item result rather than a whole request.
+
+    Used when one request covers several inputs (e.g. batched extraction)
+    but results should be reused input by input across runs.
+
+    Args:
+        namespace: Prompt version/model the result depends on
+        item: Input text
+
+    Returns:
+        SHA-256 digest of (namespace, item)
+    """
+    payload = json.dumps({"namespace": namespace, "item": item}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).digest()
+
+
+def get_cached(key: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached response.
+
+    Returns:
+        Response dict in the same shape as LLMClient.chat(), or None on miss
+    """
+    with _lock:
+        row = _get_connection().execute(
+            "SELECT response FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+    if row is None:
+        return None
+
+    stored = fast_loads(row[0])
+    return {
+        "text": stored["text"],
+        "texts": stored.get("texts") or [stored["text"]],
+        "usage": {},
+        "latency_ms": 0,
+        "raw": None,
+        "meta": {
+            "retry_count": 0,
+            "backoff_ms_total": 0,
+            "overflow_handled": False,
+            "cache_hit": True,
+        },
+    }
+
+
+def put_cached(key: bytes, response: Dict[str, Any]) -> None:
+    """Store a response; responses without text are never cached."""
+    if response.get("text") is None:
+        return
+
+    stored = fast_dumps({"text": response["text"], "texts": response.get("texts")})
+    with _lock:
+        conn = _get_connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+            (key, stored, int(time.time())),
+        )
+        conn.commit()
+
+
+def _should_cache(temperature: Optional[float], cache: Optional[bool]) -> bool:
+    """Decide whether a call is eligible for caching."""
+    from .config_loader import is_cache_enabled
+
+    if not is_cache_enabled():
+        return False
+    if cache is not None:
+        return cache
+    return not temperature
+
+
+def _accepted(response: Optional[Dict[str, Any]], accept: Optional[Callable[[str], bool]]) -> bool:
+    """Tell whether a response may be served from or stored in the cache."""
+    if response is None or response.get("text") is None:
+        return False
+    return accept is None or accept(response["text"])
+
+
+def cached_chat(
+    client: Any,
+    messages: List[Dict[str, str]],
+    cache: Optional[bool] = None,
+    nonce: Optional[Any] = None,
+    accept: Optional[Callable[[str], bool]] = None,
+    **kwargs,
+) -> Dict[str, Any]:
+    """
+    Drop-in replacement for client.chat() backed by the on-disk cache.
+
+    Args:
+        client: LLMClient instance
+        messages: OpenAI-style messages array
+        cache: Force caching on/off (default: cache only temperature == 0)
+        nonce: Optional discriminator for storing several samples per prompt
+        accept: Optional check on the response text; responses it rejects
+            are neither stored nor replayed
+        **kwargs: Passed through to client.chat()
+
+    Returns:
+        Same format as LLMClient.chat(); meta.cache_hit is True on hits
+    """
+    if not _should_cache(kwargs.get("temperature"), cache):
+        return client.chat(messages, **kwargs)
+
+    key = make_key(
+        client, messages, kwargs.get("temperature"), kwargs.get("max_tokens"),
+        nonce, kwargs.get("n", 1),
+    )
+    cached = get_cached(key)
+    if _accepted(cached, accept):
+        return cached
+
+    response = client.chat(messages, **kwargs)
+    if _accepted(response, accept):
+        put_cached(key, response)
+    return response
+
+
+async def acached_chat(
+    client: Any,
+    messages: List[Dict[str, str]],
+    cache: Optional[bool] = None,
+    nonce: Optional[Any] = None,
+    accept: Optional[Callable[[str], bool]] = None,
+    **kwargs,
+) -> Dict[str, Any]:
+    """Async sibling of cached_chat() wrapping client.achat()."""
+    if not _should_cache(kwargs.get("temperature"), cache):
+        return await client.achat(messages, **kwargs)
+
+    key = make_key(
+        client, messages, kwargs.get("temperature"), kwargs.get("max_tokens"),
+        nonce, kwargs.get("n", 1),
+    )
+    cached = get_cached(key)
+    if _accepted(cached, accept):
+        return cached
+
+    response = await client.achat(messages, **kwargs)
+    if _accepted(response, accept):
+        put_cached(key, response)
+    return response
+
+
+def clear_cache() -> None:
+    """Delete all cached responses (use with caution)."""
+    with _lock:
+        conn = _get_connection()
+        conn.execute("DELETE FROM responses")
+        conn.commit()
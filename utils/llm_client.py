@@ -4,18 +4,22 @@ Unified LLM client with multi-provider support, retry logic, and token guards.
 Supports:
 - OpenAI, Google Gemini, Groq via single abstraction
 - Automatic retry with exponential backoff for 429/5xx/timeouts
+- Async variant (achat) for concurrent fan-out over many prompts
+- Provider batch jobs (submit_batch / get_batch_results) for offline bulk runs
 - Token estimation pre-call with context overflow handling
 - Usage reconciliation (estimated vs actual tokens)
 - Comprehensive error handling
 """
 
 import time
+import json
 import random
-from typing import Literal, Optional, Any, Dict, List
-from openai import OpenAI, OpenAIError
+import asyncio
+from typing import Literal, Optional, Any, Dict, List, Tuple
+from openai import OpenAI, AsyncOpenAI, OpenAIError
 from google import genai
 from google.genai import types
-from groq import Groq
+from groq import Groq, AsyncGroq
 from dotenv import load_dotenv
 import os
 
@@ -29,6 +33,17 @@ from .router import get_context_window
 # Load environment variables
 load_dotenv()
 
+# Gemini batch states in which the job has not finished yet
+_GOOGLE_BATCH_RUNNING = {
+    "JOB_STATE_PENDING", "JOB_STATE_QUEUED", "JOB_STATE_RUNNING",
+    "JOB_STATE_UPDATING", "JOB_STATE_PAUSED", "JOB_STATE_CANCELLING",
+}
+# Finished Gemini states that still carry per-request responses
+_GOOGLE_BATCH_DONE = {"JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED"}
+
+# Shared clients keyed by (provider, model), see get_client()
+_clients: Dict[Tuple[str, str], "LLMClient"] = {}
+
 
 class LLMClient:
     """
@@ -69,6 +84,7 @@ class LLMClient:
         self.backoff_base = backoff_base if backoff_base is not None else get_backoff_base()
         self.backoff_jitter = backoff_jitter if backoff_jitter is not None else get_backoff_jitter()
         self.hard_prompt_cap = hard_prompt_cap
+        self._async_client = None
 
         # Initialize provider client
         self._init_client()
@@ -133,6 +149,7 @@ class LLMClient:
         context_strs: Optional[List[str]] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        n: int = 1,
         **kwargs,
     ) -> Dict[str, Any]:
         """
@@ -143,11 +160,123 @@ class LLMClient:
             context_strs: Optional context strings (counted separately)
             temperature: Sampling temperature
             max_tokens: Max completion tokens
+            n: Number of samples to generate server-side in one request
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Dict with text (first sample), texts (all samples), usage
+            (estimated + actual), latency_ms, meta
+        """
+        messages, context_strs, token_counts, overflow_handled = self._prepare_messages(
+            messages, context_strs
+        )
+
+        # Retry loop
+        retry_count = 0
+        total_backoff_ms = 0
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                start_time = time.time()
+
+                # Call provider-specific implementation
+                if self.provider == "openai":
+                    response = self._call_openai(messages, temperature, max_tokens, n, **kwargs)
+                elif self.provider == "google":
+                    response = self._call_google(messages, temperature, max_tokens, n, **kwargs)
+                elif self.provider == "groq":
+                    response = self._call_groq(messages, temperature, max_tokens, n, **kwargs)
+                else:
+                    raise ValueError(f"Unsupported provider: {self.provider}")
+
+                latency_ms = int((time.time() - start_time) * 1000)
+
+                return self._build_result(
+                    response, token_counts, latency_ms,
+                    retry_count, total_backoff_ms, overflow_handled,
+                )
+
+            except Exception as e:
+                last_error = e
+                backoff_sec = self._handle_call_error(e, attempt, overflow_handled)
+                retry_count += 1
+                total_backoff_ms += int(backoff_sec * 1000)
+                time.sleep(backoff_sec)
+
+        # Should not reach here, but just in case
+        raise last_error or Exception("Unknown error in LLM call")
+
+    async def achat(
+        self,
+        messages: List[Dict[str, str]],
+        context_strs: Optional[List[str]] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        n: int = 1,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Async sibling of chat() for running many requests concurrently.
+
+        Uses the provider SDK's async client, so the event loop is free while
+        the request is in flight. Callers are expected to bound concurrency
+        themselves (e.g. with an asyncio.Semaphore) to stay under rate limits.
+
+        Args:
+            messages: OpenAI-style messages array
+            context_strs: Optional context strings (counted separately)
+            temperature: Sampling temperature
+            max_tokens: Max completion tokens
+            n: Number of samples to generate server-side in one request
             **kwargs: Additional provider-specific parameters
 
         Returns:
-            Dict with text, usage (estimated + actual), latency_ms, meta
+            Same format as chat()
         """
+        messages, context_strs, token_counts, overflow_handled = self._prepare_messages(
+            messages, context_strs
+        )
+
+        retry_count = 0
+        total_backoff_ms = 0
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                start_time = time.time()
+
+                if self.provider == "openai":
+                    response = await self._acall_openai(messages, temperature, max_tokens, n, **kwargs)
+                elif self.provider == "google":
+                    response = await self._acall_google(messages, temperature, max_tokens, n, **kwargs)
+                elif self.provider == "groq":
+                    response = await self._acall_groq(messages, temperature, max_tokens, n, **kwargs)
+                else:
+                    raise ValueError(f"Unsupported provider: {self.provider}")
+
+                latency_ms = int((time.time() - start_time) * 1000)
+
+                return self._build_result(
+                    response, token_counts, latency_ms,
+                    retry_count, total_backoff_ms, overflow_handled,
+                )
+
+            except Exception as e:
+                last_error = e
+                backoff_sec = self._handle_call_error(e, attempt, overflow_handled)
+                retry_count += 1
+                total_backoff_ms += int(backoff_sec * 1000)
+                await asyncio.sleep(backoff_sec)
+
+        raise last_error or Exception("Unknown error in LLM call")
+
+    def _prepare_messages(
+        self,
+        messages: List[Dict[str, str]],
+        context_strs: Optional[List[str]],
+    ) -> Tuple[List[Dict[str, str]], Optional[List[str]], Dict[str, Any], bool]:
+        """Estimate tokens and apply the hard prompt cap before a call."""
         # Pre-call token estimation
         token_counts = count_messages_tokens(
             messages, self.provider, self.model, context_strs
@@ -171,85 +300,78 @@ class LLMClient:
                 messages, self.provider, self.model, context_strs
             )
 
-        # Retry loop
-        retry_count = 0
-        total_backoff_ms = 0
-        last_error = None
-
-        for attempt in range(self.max_retries + 1):
-            try:
-                start_time = time.time()
+        return messages, context_strs, token_counts, overflow_handled
 
-                # Call provider-specific implementation
-                if self.provider == "openai":
-                    response = self._call_openai(messages, temperature, max_tokens, **kwargs)
-                elif self.provider == "google":
-                    response = self._call_google(messages, temperature, max_tokens, **kwargs)
-                elif self.provider == "groq":
-                    response = self._call_groq(messages, temperature, max_tokens, **kwargs)
-                else:
-                    raise ValueError(f"Unsupported provider: {self.provider}")
+    def _build_result(
+        self,
+        response: Dict[str, Any],
+        token_counts: Dict[str, Any],
+        latency_ms: int,
+        retry_count: int,
+        total_backoff_ms: int,
+        overflow_handled: bool,
+    ) -> Dict[str, Any]:
+        """Build the provider-independent result dict returned by chat()."""
+        # Extract text and usage
+        text = response["text"]
+        provider_usage = response.get("usage")
 
-                latency_ms = int((time.time() - start_time) * 1000)
+        # Reconcile token usage
+        usage = reconcile_usage(token_counts, provider_usage)
 
-                # Extract text and usage
-                text = response["text"]
-                provider_usage = response.get("usage")
-
-                # Reconcile token usage
-                usage = reconcile_usage(token_counts, provider_usage)
-
-                return {
-                    "text": text,
-                    "usage": usage,
-                    "latency_ms": latency_ms,
-                    "raw": response.get("raw"),
-                    "meta": {
-                        "retry_count": retry_count,
-                        "backoff_ms_total": total_backoff_ms,
-                        "overflow_handled": overflow_handled,
-                    },
-                }
+        return {
+            "text": text,
+            "texts": response.get("texts") or [text],
+            "usage": usage,
+            "latency_ms": latency_ms,
+            "raw": response.get("raw"),
+            "meta": {
+                "retry_count": retry_count,
+                "backoff_ms_total": total_backoff_ms,
+                "overflow_handled": overflow_handled,
+            },
+        }
 
-            except Exception as e:
-                last_error = e
+    def _handle_call_error(
+        self, error: Exception, attempt: int, overflow_handled: bool
+    ) -> float:
+        """
+        Decide what to do with a failed provider call.
 
-                # Check if we should retry
-                if attempt < self.max_retries and self._is_retryable_error(e):
-                    retry_count += 1
-                    backoff_sec = self._calculate_backoff(attempt)
-                    backoff_ms = int(backoff_sec * 1000)
-                    total_backoff_ms += backoff_ms
-
-                    time.sleep(backoff_sec)
-                    continue
-
-                # Context overflow error - try summarization
-                error_str = str(e).lower()
-                if (
-                    "context" in error_str
-                    and ("length" in error_str or "too long" in error_str)
-                    and not overflow_handled
-                ):
-                    # This should be handled by caller using overflow_summarize prompt
-                    raise ValueError(
-                        "Context window exceeded. Use overflow_summarize.v1 prompt."
-                    ) from e
-
-                # Non-retryable error or max retries exceeded
-                raise
+        Returns:
+            Backoff in seconds if the call should be retried
 
-        # Should not reach here, but just in case
-        raise last_error or Exception("Unknown error in LLM call")
+        Raises:
+            The original error (or a context overflow ValueError) otherwise
+        """
+        # Check if we should retry
+        if attempt < self.max_retries and self._is_retryable_error(error):
+            return self._calculate_backoff(attempt)
 
-    def _call_openai(
+        # Context overflow error - try summarization
+        error_str = str(error).lower()
+        if (
+            "context" in error_str
+            and ("length" in error_str or "too long" in error_str)
+            and not overflow_handled
+        ):
+            # This should be handled by caller using overflow_summarize prompt
+            raise ValueError(
+                "Context window exceeded. Use overflow_summarize.v1 prompt."
+            ) from error
+
+        # Non-retryable error or max retries exceeded
+        raise error
+
+    def _openai_params(
         self,
         messages: List[Dict[str, str]],
         temperature: Optional[float],
         max_tokens: Optional[int],
+        n: int = 1,
         **kwargs,
     ) -> Dict[str, Any]:
-        """Call OpenAI API."""
+        """Build OpenAI chat.completions parameters."""
         params = {
             "model": self.model,
             "messages": messages,
@@ -271,12 +393,43 @@ class LLMClient:
             else:
                 params["max_tokens"] = max_tokens
 
+        if n > 1:
+            params["n"] = n
+
         params.update(kwargs)
+        return params
 
-        response = self.client.chat.completions.create(**params)
+    def _groq_params(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        n: int = 1,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Build Groq chat.completions parameters (OpenAI-compatible)."""
+        params = {
+            "model": self.model,
+            "messages": messages,
+        }
 
+        if temperature is not None:
+            params["temperature"] = temperature
+        if max_tokens is not None:
+            params["max_tokens"] = max_tokens
+
+        if n > 1:
+            params["n"] = n
+
+        params.update(kwargs)
+        return params
+
+    @staticmethod
+    def _parse_completion(response: Any) -> Dict[str, Any]:
+        """Normalize an OpenAI-compatible chat completion response."""
         return {
             "text": response.choices[0].message.content or "",
+            "texts": [choice.message.content or "" for choice in response.choices],
             "usage": {
                 "prompt_tokens": response.usage.prompt_tokens if response.usage else None,
                 "completion_tokens": response.usage.completion_tokens if response.usage else None,
@@ -285,14 +438,15 @@ class LLMClient:
             "raw": response,
         }
 
-    def _call_google(
+    def _google_request(
         self,
         messages: List[Dict[str, str]],
         temperature: Optional[float],
         max_tokens: Optional[int],
+        n: int = 1,
         **kwargs,
     ) -> Dict[str, Any]:
-        """Call Google Gemini API using new google-genai SDK."""
+        """Convert OpenAI-style messages into generate_content arguments."""
         # Convert OpenAI format to Gemini format
         gemini_contents = []
         system_instruction = None
@@ -320,16 +474,20 @@ class LLMClient:
             config_params["max_output_tokens"] = max_tokens
         if system_instruction:
             config_params["system_instruction"] = system_instruction
+        if n > 1:
+            config_params["candidate_count"] = n
 
         generation_config = types.GenerateContentConfig(**config_params) if config_params else None
 
-        # Generate content using new client API
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=gemini_contents,
-            config=generation_config,
-        )
+        return {
+            "model": self.model,
+            "contents": gemini_contents,
+            "config": generation_config,
+        }
 
+    @staticmethod
+    def _parse_google(response: Any) -> Dict[str, Any]:
+        """Normalize a Gemini generate_content response."""
         # Extract usage metadata
         usage = {}
         if hasattr(response, "usage_metadata") and response.usage_metadata:
@@ -338,43 +496,110 @@ class LLMClient:
                 "candidatesTokenCount": response.usage_metadata.candidates_token_count,
             }
 
+        # One text per candidate (candidate_count > 1 returns several)
+        texts = []
+        for candidate in response.candidates or []:
+            parts = candidate.content.parts if candidate.content and candidate.content.parts else []
+            texts.append("".join(part.text for part in parts if part.text) or None)
+
         return {
             "text": response.text,
+            "texts": texts,
             "usage": usage,
             "raw": response,
         }
 
+    def _call_openai(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        n: int = 1,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call OpenAI API."""
+        params = self._openai_params(messages, temperature, max_tokens, n, **kwargs)
+        response = self.client.chat.completions.create(**params)
+        return self._parse_completion(response)
+
+    def _call_google(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        n: int = 1,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call Google Gemini API using new google-genai SDK."""
+        request = self._google_request(messages, temperature, max_tokens, n, **kwargs)
+        response = self.client.models.generate_content(**request)
+        return self._parse_google(response)
+
     def _call_groq(
         self,
         messages: List[Dict[str, str]],
         temperature: Optional[float],
         max_tokens: Optional[int],
+        n: int = 1,
         **kwargs,
     ) -> Dict[str, Any]:
         """Call Groq API (OpenAI-compatible)."""
-        params = {
-            "model": self.model,
-            "messages": messages,
-        }
-
-        if temperature is not None:
-            params["temperature"] = temperature
-        if max_tokens is not None:
-            params["max_tokens"] = max_tokens
+        params = self._groq_params(messages, temperature, max_tokens, n, **kwargs)
+        response = self.client.chat.completions.create(**params)
+        return self._parse_completion(response)
+
+    def _get_async_client(self) -> Any:
+        """Lazily create the provider's async client (reused across calls)."""
+        if self._async_client is None:
+            if self.provider == "openai":
+                self._async_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            elif self.provider == "google":
+                # google-genai exposes its async surface on the same client
+                self._async_client = self.client.aio
+            elif self.provider == "groq":
+                self._async_client = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
+            else:
+                raise ValueError(f"Unsupported provider: {self.provider}")
+        return self._async_client
 
-        params.update(kwargs)
+    async def _acall_openai(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        n: int = 1,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call OpenAI API asynchronously."""
+        params = self._openai_params(messages, temperature, max_tokens, n, **kwargs)
+        response = await self._get_async_client().chat.completions.create(**params)
+        return self._parse_completion(response)
 
-        response = self.client.chat.completions.create(**params)
+    async def _acall_google(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        n: int = 1,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call Google Gemini API asynchronously."""
+        request = self._google_request(messages, temperature, max_tokens, n, **kwargs)
+        response = await self._get_async_client().models.generate_content(**request)
+        return self._parse_google(response)
 
-        return {
-            "text": response.choices[0].message.content or "",
-            "usage": {
-                "prompt_tokens": response.usage.prompt_tokens if response.usage else None,
-                "completion_tokens": response.usage.completion_tokens if response.usage else None,
-                "total_tokens": response.usage.total_tokens if response.usage else None,
-            },
-            "raw": response,
-        }
+    async def _acall_groq(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        n: int = 1,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call Groq API asynchronously."""
+        params = self._groq_params(messages, temperature, max_tokens, n, **kwargs)
+        response = await self._get_async_client().chat.completions.create(**params)
+        return self._parse_completion(response)
 
     def json_chat(
         self,
@@ -427,3 +652,122 @@ class LLMClient:
 
         return self.chat(messages, temperature=temperature, **kwargs)
 
+    def submit_batch(self, requests: List[Dict[str, Any]]) -> str:
+        """
+        Submit chat requests as one asynchronous provider batch job.
+
+        Batch jobs trade latency (up to 24h) for lower cost and no per-call
+        rate limiting. Gemini takes the requests inline; OpenAI and Groq
+        take an uploaded JSONL file.
+
+        Args:
+            requests: List of dicts with messages and optional temperature/max_tokens
+
+        Returns:
+            Provider batch job identifier (pass to get_batch_results)
+        """
+        if self.provider == "google":
+            src = []
+            for req in requests:
+                request = self._google_request(
+                    req["messages"], req.get("temperature"), req.get("max_tokens")
+                )
+                src.append(types.InlinedRequest(contents=request["contents"], config=request["config"]))
+            job = self.client.batches.create(model=self.model, src=src)
+            return job.name
+
+        if self.provider in ("openai", "groq"):
+            build_params = self._openai_params if self.provider == "openai" else self._groq_params
+            lines = []
+            for i, req in enumerate(requests):
+                body = build_params(req["messages"], req.get("temperature"), req.get("max_tokens"))
+                lines.append(json.dumps({
+                    "custom_id": f"request-{i}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body,
+                }))
+            batch_file = self.client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            job = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            return job.id
+
+        raise ValueError(f"Unsupported provider: {self.provider}")
+
+    def get_batch_results(self, job_id: str) -> Optional[List[Optional[str]]]:
+        """
+        Check a batch job submitted with submit_batch().
+
+        Returns:
+            None while the job is still running (including while it is being
+            updated, paused or cancelled), otherwise one response text per
+            submitted request (None for requests that failed, e.g. in a
+            partially succeeded job)
+
+        Raises:
+            RuntimeError: If the job failed, expired or was cancelled
+        """
+        if self.provider == "google":
+            job = self.client.batches.get(name=job_id)
+            state = job.state.name
+            if state in _GOOGLE_BATCH_RUNNING:
+                return None
+            if state not in _GOOGLE_BATCH_DONE:
+                raise RuntimeError(f"Batch job {job_id} ended with state {state}")
+            # Responses for failed requests (or a missing dest) come back as None
+            inlined = (job.dest.inlined_responses if job.dest else None) or []
+            return [
+                item.response.text if item.response is not None else None
+                for item in inlined
+            ]
+
+        if self.provider in ("openai", "groq"):
+            job = self.client.batches.retrieve(job_id)
+            if job.status in ("validating", "in_progress", "finalizing", "cancelling"):
+                return None
+            if job.status != "completed":
+                raise RuntimeError(f"Batch job {job_id} ended with status {job.status}")
+
+            texts: Dict[int, Optional[str]] = {}
+            if job.output_file_id:
+                for line in self.client.files.content(job.output_file_id).text.splitlines():
+                    record = json.loads(line)
+                    index = int(record["custom_id"].rsplit("-", 1)[1])
+                    body = (record.get("response") or {}).get("body") or {}
+                    choices = body.get("choices") or []
+                    texts[index] = choices[0]["message"]["content"] if choices else None
+
+            total = job.request_counts.total if job.request_counts else len(texts)
+            return [texts.get(i) for i in range(total)]
+
+        raise ValueError(f"Unsupported provider: {self.provider}")
+
+
+def get_client(
+    provider: Literal["openai", "google", "groq"],
+    model: str,
+) -> LLMClient:
+    """
+    Get the shared LLMClient for a provider/model, creating it on first use.
+
+    Reusing one client per model keeps the provider SDK's HTTP connection
+    pool warm, so repeated calls (and modules that use the same model, like
+    cot_scoring and logistic_commander) skip connection and TLS setup.
+
+    Args:
+        provider: API provider (openai, google, groq)
+        model: Model identifier
+
+    Returns:
+        Shared LLMClient instance
+    """
+    key = (provider, model)
+    if key not in _clients:
+        _clients[key] = LLMClient(provider, model)
+    return _clients[key]
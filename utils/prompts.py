@@ -120,6 +120,22 @@ PROMPTS: Dict[str, PromptSpec] = {
         max_tokens=400,
         stop=None,
     ),
+    "json_extract_batch.v1": PromptSpec(
+        id="json_extract_batch.v1",
+        purpose="Schema-first JSON extraction for several numbered texts in one call",
+        template=(
+            "Extract the requested fields from EACH numbered text below and return ONLY a valid "
+            "JSON array with exactly ${count} objects, one per text, in the same order.\n"
+            "Each object must match this schema and also include an integer \"index\" field "
+            "giving the number of the text it was extracted from:\n"
+            "${schema}\n\n"
+            "Texts:\n${texts}\n\n"
+            "Return ONLY the JSON array, no extra text."
+        ),
+        temperature=0.0,
+        max_tokens=4000,  # ~400 per object for batches of up to 10 texts
+        stop=None,
+    ),
     "tool_call.v1": PromptSpec(
         id="tool_call.v1",
         purpose="Instruct model to choose & call a tool when needed",
@@ -0,0 +1,64 @@
+"""
+Async rate limiting for pipeline-level LLM fan-out.
+
+A semaphore caps how many requests are in flight; this module caps how
+many start per minute. The limiter is a token bucket: it refills
+continuously, so a burst of fast responses does not stall the pipeline
+and a slow response does not hold back the next request.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket allowing `rate` acquisitions per `period` seconds.
+
+    Usage:
+        limiter = AsyncRateLimiter(10)  # 10 requests per minute
+        async with limiter:
+            response = await client.achat(messages)
+    """
+
+    def __init__(self, rate: float, period: float = 60.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Requests allowed per period (also the maximum burst size)
+            period: Window length in seconds
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._last: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last check."""
+        now = time.monotonic()
+        if self._last is not None:
+            earned = (now - self._last) * self.rate / self.period
+            self._tokens = min(self.rate, self._tokens + earned)
+        self._last = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may start, then consume one token."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> bool:
+        return False
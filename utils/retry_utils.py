@@ -0,0 +1,108 @@
+"""
+Retry delay helpers for pipeline-level retry loops.
+
+LLMClient already retries transient provider errors internally. The
+pipeline scripts add an outer loop (for empty or malformed responses and
+for errors that survive the client's retries); these helpers give that
+loop exponential backoff with jitter, honour Retry-After on 429s and
+stop early on errors that retrying cannot fix.
+"""
+
+import random
+import re
+from typing import Optional
+
+
+# Matches "Retry-After: 7", "retry after 7s", "'retryDelay': '7s'", ...
+_RETRY_AFTER_RE = re.compile(r"retry[\s_-]?(?:after|delay)\W*(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+# HTTP statuses that fail the same way on every attempt
+_PERMANENT_STATUSES = {400, 401, 403, 404, 422}
+_PERMANENT_MARKERS = ("api key", "api_key", "unauthorized", "permission denied", "invalid_request")
+
+
+def is_permanent_error(error: BaseException) -> bool:
+    """
+    Tell whether retrying an error is pointless.
+
+    Auth failures, bad requests and unknown models are permanent; rate
+    limits, 5xx, timeouts and malformed model output are transient.
+
+    Args:
+        error: Exception raised by the provider call
+
+    Returns:
+        True if the error will not go away on retry
+    """
+    # OpenAI/Groq errors carry status_code, google-genai errors carry code
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if isinstance(status, int):
+        return status in _PERMANENT_STATUSES
+
+    message = str(error).lower()
+    return any(marker in message for marker in _PERMANENT_MARKERS)
+
+
+def parse_retry_after(error: BaseException) -> Optional[float]:
+    """
+    Extract a server-requested retry delay from an API error.
+
+    Checks the HTTP Retry-After header when the error carries a response
+    (OpenAI/Groq/httpx errors), then falls back to parsing the message
+    (Gemini reports RetryInfo.retryDelay in the error text).
+
+    Args:
+        error: Exception raised by the provider call
+
+    Returns:
+        Delay in seconds, or None if the error does not specify one
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers:
+        value = headers.get("retry-after")
+        if value is not None:
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                pass
+
+    match = _RETRY_AFTER_RE.search(str(error))
+    if match:
+        return float(match.group(1))
+
+    return None
+
+
+def retry_delay(
+    attempt: int,
+    error: Optional[BaseException] = None,
+    base: float = 1.0,
+    cap: Optional[float] = None,
+) -> float:
+    """
+    Compute how long to wait before the next attempt.
+
+    Rate-limited errors wait for the server's Retry-After; everything else
+    uses min(base * 2**attempt, cap) scaled by a random factor in
+    [0.5, 1.5) so concurrent workers do not retry in lockstep.
+
+    Args:
+        attempt: Zero-based attempt number that just failed
+        error: Exception from the failed attempt, if any
+        base: Delay in seconds for the first retry
+        cap: Maximum backoff before jitter (None = config retry.backoff.max_seconds)
+
+    Returns:
+        Delay in seconds
+    """
+    if error is not None:
+        retry_after = parse_retry_after(error)
+        if retry_after is not None:
+            return retry_after
+
+    if cap is None:
+        from .config_loader import get_backoff_max
+        cap = get_backoff_max()
+
+    return min(base * (2 ** attempt), cap) * random.uniform(0.5, 1.5)